@@ -1,189 +1,458 @@
 """
 Procedural audio generation.
 Creates all sound effects at runtime using NumPy waveform synthesis.
+
+Sample buffers are synthesized once, cached per process and on disk;
+every generate_*() call wraps the cached buffer in a fresh pygame Sound.
+LazySound defers that work until a sound is first used, and
+prefetch_sounds() does it on a background thread during startup.
 """
 
+import hashlib
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
 import numpy as np
 import pygame
-from config import SAMPLE_RATE
+from config import SAMPLE_RATE, SOUND_CACHE_DIR
 
-def low_pass(signal, kernel_size):
-    kernel = np.ones(kernel_size) / kernel_size
-    return np.convolve(signal, kernel, mode="same")
+# Part of every disk cache key. Each cached generator's own code, constants
+# and parameters are already fingerprinted into its key; bump this only when
+# a shared helper it calls (_partials, _to_stereo_int16, envelopes, ...)
+# changes, or the old buffers keep being replayed from SOUND_CACHE_DIR.
+_SOUND_CACHE_VERSION = 1
 
-def generate_backrooms_hum():
-    """Generate ambient droning hum."""
-    duration = 10
-    samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, samples, False)
+# PCG64 generator: faster than the legacy np.random state and can draw
+# float32 directly
+_RNG = np.random.default_rng()
 
-    drone = 0.15 * np.sin(2 * np.pi * 60 * t)
-    drone += 0.12 * np.sin(2 * np.pi * 55 * t)
-    drone += 0.10 * np.sin(2 * np.pi * 40 * t)
-    drone += 0.08 * np.sin(2 * np.pi * 120 * t)
-    drone += 0.05 * np.sin(2 * np.pi * 180 * t)
+# Free lists of transient work buffers, keyed by (shape, dtype)
+_SCRATCH_POOL = {}
+
+def low_pass(signal, kernel_size):
+    """Box filter matching np.convolve(signal, ones(k) / k, mode="same").
 
-    modulation = 0.5 + 0.5 * np.sin(2 * np.pi * 0.1 * t)
-    drone *= modulation
-    noise = np.random.normal(0, 0.02, samples)
-    drone += noise
+    Each output is the difference of two prefix sums rather than a
+    kernel_size-tap dot product, so the cost is O(N) whatever the width.
+    Prefix sums are accumulated in float64 to keep the differences exact.
+    """
+    n = signal.size
+    lead = (kernel_size - 1) // 2 + 1
 
-    drone = drone / np.max(np.abs(drone)) * 0.6
-    audio = np.array(drone * 32767, dtype=np.int16)
-    stereo_audio = np.column_stack((audio, audio))
+    # prefix[kernel_size + j] = sum(signal[:j]), zero before, flat after
+    prefix = np.zeros(n + 2 * kernel_size)
+    np.cumsum(signal, dtype=np.float64, out=prefix[kernel_size + 1:kernel_size + 1 + n])
+    prefix[kernel_size + 1 + n:] = prefix[kernel_size + n]
 
-    return pygame.sndarray.make_sound(stereo_audio)
+    window = prefix[kernel_size + lead:kernel_size + lead + n] - prefix[lead:lead + n]
+    window /= kernel_size
+    return window.astype(signal.dtype, copy=False)
 
 
-def generate_footstep_sound():
-    """Generate ambient footstep sound (distant)."""
-    duration = 0.3
-    samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, samples, False)
+def _block_grid(samples):
+    """Split sample indices as n = row * block + col, block ≈ √samples.
 
-    impact = np.exp(-t * 20) * np.sin(2 * np.pi * 80 * t)
-    impact += np.exp(-t * 15) * np.sin(2 * np.pi * 120 * t) * 0.5
-    reverb = np.exp(-t * 5) * np.random.normal(0, 0.1, samples)
+    Returns (row_n, col_n): the first index of each row and the in-row
+    offsets. Anything separable over that split — sines via angle addition,
+    exponentials via exp(a + b) = exp a·exp b — is evaluated on ~2√samples
+    points and expanded with an outer product instead of per sample.
+    """
+    block = int(np.ceil(np.sqrt(samples)))
+    rows = -(-samples // block)
+    return np.arange(rows) * block, np.arange(block)
 
-    sound = impact + reverb * 0.3
-    sound = sound / np.max(np.abs(sound)) * 0.7
 
-    audio = np.array(sound * 32767, dtype=np.int16)
-    stereo_audio = np.column_stack((audio, audio))
+def _partials(samples, freqs, amps, decays=None, phases=None):
+    """Sum of amps[k] * sin(2π·freqs[k]·t + phases[k]) [* exp(-decays[k]·t)].
 
-    return pygame.sndarray.make_sound(stereo_audio)
+    No sin or exp is evaluated per sample. The sample index is split by
+    _block_grid(); angle addition
+    (sin(a + b) = sin a·cos b + cos a·sin b) and exp(a + b) = exp a·exp b
+    factor every damped partial into per-row and per-column tables, so the
+    whole mix is one small matrix product — a vectorized stand-in for a
+    recursive oscillator, without its drift, and without ever allocating
+    separate exp and sin temporaries for the damped terms.
 
+    The row/column tables are in effect exact per-partial sine tables of
+    ~√samples entries each (≈470 for the 10 s hum), so a quantized global
+    sine LUT with interpolation would cost more lookups and lose accuracy.
 
-def generate_player_footstep_sound(turn_factor=1.0):
-    """Generate deep, soft carpet footstep (pressure into fabric).
-    turn_factor: 0.0 (straight) → 1.0 (hard turn)
+    Tables and output are float32: the result is quantized to int16
+    anyway, and half-width samples halve the memory traffic of every pass.
+    Angles and envelopes are formed in float64 before narrowing.
     """
-    duration = 0.14
-    samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, samples, False)
+    freqs = np.asarray(freqs, dtype=float)
+    amps = np.asarray(amps, dtype=float)
+    offsets = np.zeros_like(freqs) if phases is None else np.asarray(phases, dtype=float)
 
-    # Clamp for safety
-    turn_factor = max(0.0, min(turn_factor, 1.0))
+    row_n, col_n = _block_grid(samples)
+    omega = 2 * np.pi * freqs / SAMPLE_RATE
 
-    # Fabric noise (very gentle)
-    noise = np.random.uniform(-1, 1, samples)
+    row_angle = np.multiply.outer(omega, row_n)
+    row_angle += offsets[:, None]
+    col_angle = np.multiply.outer(omega, col_n)
 
-    # Soft envelope: slow rise, smooth release
-    attack = int(0.35 * samples)
-    decay = samples - attack
-    envelope = np.concatenate([
-        np.linspace(0, 1, attack),
-        np.linspace(1, 0, decay)
-    ])
+    # Stack [sin; cos] rows against [cos; sin] columns: the amplitude and
+    # envelope factors are applied once per table and the mix is one GEMM
+    row = np.stack([np.sin(row_angle), np.cos(row_angle)])
+    col = np.stack([np.cos(col_angle), np.sin(col_angle)])
+    row_weight = np.broadcast_to(amps[:, None], row_angle.shape)
 
-    # Directional carpet absorption (fiber shear when turning)
-    kernel_size = int(65 + turn_factor * 25)
-    muffled = low_pass(noise, kernel_size=kernel_size)
+    if decays is not None:
+        rate = np.asarray(decays, dtype=float) / SAMPLE_RATE
+        row_weight = row_weight * np.exp(np.multiply.outer(-rate, row_n))
+        col *= np.exp(np.multiply.outer(-rate, col_n))
 
-    # Deep pressure "crush" (felt, not heard)
-    bass = (
-        0.08 * np.sin(2 * np.pi * 38 * t) +
-        0.04 * np.sin(2 * np.pi * 28 * t)
-    ) * np.exp(-t * 18)
+    row *= row_weight
+    signal = row.reshape(-1, row_n.size).astype(np.float32).T @ \
+        col.reshape(-1, col_n.size).astype(np.float32)
+    return signal.ravel()[:samples]
 
-    sound = muffled * envelope * 0.3 + bass
 
-    # Extremely conservative output level
-    sound = sound / np.max(np.abs(sound)) * 0.32
+def _modulated(freqs, amps, mod_freq, offset=0.5, depth=0.5):
+    """Expand partials × (offset + depth·sin(2π·mod_freq·t)) into plain partials.
 
-    # Subtle stereo smear (body rotation, not panning)
-    left = sound * (1.0 - turn_factor * 0.08)
-    right = sound * (1.0 + turn_factor * 0.08)
+    By the product-to-sum identity each carrier a·sin(ωt) becomes
+    offset·a·sin(ωt) + (depth·a/2)·[cos((ω-μ)t) - cos((ω+μ)t)], so the
+    modulated tone is one _partials() call with no separate envelope
+    buffer or multiply pass. Returns (freqs, amps, phases).
+    """
+    out_freqs, out_amps, out_phases = [], [], []
+    for freq, amp in zip(freqs, amps):
+        side = depth * amp / 2
+        out_freqs += [freq, freq - mod_freq, freq + mod_freq]
+        out_amps += [offset * amp, side, side]
+        out_phases += [0.0, np.pi / 2, -np.pi / 2]
+    return out_freqs, out_amps, out_phases
+
+
+def _to_stereo_int16(signal, gain, balance=0.0):
+    """Normalize signal to peak `gain` and pack it into an (N, 2) int16 buffer.
+
+    signal is mono (N,) / (N, 1), or (N, 2) when layers were synthesized
+    per channel. The mixer runs in stereo so play_directional_sound() can
+    pan each channel. Both columns are scaled straight into the int16
+    buffer by one broadcast multiply with an unsafe-cast ufunc `out=`, so
+    no float or int16 temporaries are made. balance tilts the level right
+    (> 0) or left (< 0) by that fraction.
+    """
+    if signal.ndim == 1:
+        signal = signal[:, None]
+    # max/min reductions find the peak without an abs() temporary
+    peak = max(signal.max(), -signal.min())
+    scale = gain * 32767 / peak
+    channel_gain = np.array([scale * (1.0 - balance), scale * (1.0 + balance)],
+                            dtype=np.float32)
+    stereo = np.empty((signal.shape[0], 2), dtype=np.int16)
+    np.multiply(signal, channel_gain, out=stereo, casting="unsafe")
+    return stereo
+
+
+@contextmanager
+def _scratch(shape, dtype=np.float32):
+    """Borrow a work buffer from the pool, returned to it on exit.
+
+    Contents are undefined; write the whole buffer before reading it.
+    """
+    free = _SCRATCH_POOL.setdefault((shape, np.dtype(dtype).str), [])
+    try:
+        buf = free.pop()
+    except IndexError:
+        buf = np.empty(shape, dtype=dtype)
+    try:
+        yield buf
+    finally:
+        free.append(buf)
+
+
+@lru_cache(maxsize=32)
+def _decay_envelope(samples, rate):
+    """Read-only exp(-rate·t) as an (N, 1) float32 column.
+
+    Formed on the _block_grid() split like the damped partials, so only
+    ~2√samples exponentials are evaluated instead of one per sample.
+    """
+    row_n, col_n = _block_grid(samples)
+    step = rate / SAMPLE_RATE
+    envelope = np.multiply.outer(np.exp(-step * row_n), np.exp(-step * col_n))
+    envelope = envelope.astype(np.float32).reshape(-1, 1)[:samples]
+    envelope.setflags(write=False)
+    return envelope
 
-    audio_l = np.array(left * 32767, dtype=np.int16)
-    audio_r = np.array(right * 32767, dtype=np.int16)
-    stereo_audio = np.column_stack((audio_l, audio_r))
 
-    return pygame.sndarray.make_sound(stereo_audio)
+@lru_cache(maxsize=32)
+def _attack_release(samples, rise):
+    """Read-only linear envelope: 0 → 1 over `rise` samples, then back to 0."""
+    envelope = np.empty(samples, dtype=np.float32)
+    envelope[:rise] = np.linspace(0, 1, rise, dtype=np.float32)
+    envelope[rise:] = np.linspace(1, 0, samples - rise, dtype=np.float32)
+    envelope.setflags(write=False)
+    return envelope
 
 
-def generate_crouch_footstep_sound(turn_factor=1.0):
-    """Generate ultra-soft, deep carpet crouch footstep (slow pressure).
-    turn_factor: 0.0 (straight) → 1.0 (hard turn)
+def _freeze(audio):
+    """Mark a cached sample buffer read-only so callers can't corrupt it."""
+    audio.setflags(write=False)
+    return audio
+
+
+def _code_fingerprint(code, digest):
+    """Feed a function's bytecode and constants, nested code included, to digest.
+
+    Nested code objects (comprehensions, lambdas) are walked instead of
+    repr()'d, since their repr carries a per-process address.
     """
-    duration = 0.18
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _code_fingerprint(const, digest)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _disk_cached(params=None, uses=()):
+    """Keep a sample function's output in SOUND_CACHE_DIR across runs.
+
+    Files are named by a SHA-256 of the function name, its arguments, the
+    bytecode and constants of the function and of every function in `uses`
+    it forwards to, repr(params(*args)) for any config it reads from a
+    table, SAMPLE_RATE and _SOUND_CACHE_VERSION. Retuning a generator
+    therefore changes its key. A cache file that is unreadable or not an
+    (N, 2) int16 buffer is resynthesized; an unwritable cache directory is
+    ignored.
+    """
+    def decorate(synth):
+        code_digest = hashlib.sha256()
+        for func in (synth, *uses):
+            _code_fingerprint(func.__code__, code_digest)
+        code_hash = code_digest.hexdigest()
+
+        @wraps(synth)
+        def cached(*args):
+            config = repr(params(*args)) if params else ""
+            key = (f"{synth.__name__}|{args!r}|{config}|{code_hash}|"
+                   f"{SAMPLE_RATE}|{_SOUND_CACHE_VERSION}")
+            path = os.path.join(SOUND_CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + ".npy")
+            try:
+                audio = np.load(path)
+            except (OSError, ValueError):
+                audio = None
+            if (audio is not None and audio.ndim == 2 and audio.shape[1] == 2
+                    and audio.dtype == np.int16):
+                return _freeze(audio)
+
+            audio = synth(*args)
+            tmp_path = None
+            try:
+                os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+                # Write a uniquely named file then rename, so neither another
+                # thread nor another game instance ever sees half a file
+                with tempfile.NamedTemporaryFile(dir=SOUND_CACHE_DIR, suffix=".tmp",
+                                                 delete=False) as f:
+                    tmp_path = f.name
+                    np.save(f, audio)
+                os.replace(tmp_path, path)
+            except OSError:
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+            return audio
+
+        return cached
+
+    return decorate
+
+
+@lru_cache(maxsize=None)
+@_disk_cached()
+def _backrooms_hum_samples():
+    duration = 10
     samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, samples, False)
 
-    turn_factor = max(0.0, min(turn_factor, 1.0))
+    # Drones under a slow 0.5 + 0.5·sin(2π·0.1·t) swell
+    freqs, amps, phases = _modulated((60, 55, 40, 120, 180),
+                                     (0.15, 0.12, 0.10, 0.08, 0.05), 0.1)
+    drone = _partials(samples, freqs, amps, phases=phases)
 
-    # Very gentle fabric noise
-    noise = np.random.uniform(-1, 1, samples)
+    # Independent hiss per channel so the room doesn't collapse to mono
+    with _scratch((samples, 2)) as mix:
+        _RNG.standard_normal(dtype=np.float32, out=mix)
+        mix *= 0.02
+        mix += drone[:, None]
+        return _freeze(_to_stereo_int16(mix, 0.6))
 
-    # Extra-slow, smooth envelope (no perceptible onset)
-    attack = int(0.45 * samples)
-    decay = samples - attack
-    envelope = np.concatenate([
-        np.linspace(0, 1, attack),
-        np.linspace(1, 0, decay)
-    ])
 
-    # Strong absorption — more smear when turning
-    kernel_size = int(80 + turn_factor * 30)
-    muffled = low_pass(noise, kernel_size=kernel_size)
+def generate_backrooms_hum():
+    """Generate ambient droning hum."""
+    return pygame.sndarray.make_sound(_backrooms_hum_samples())
+
+
+# Footstep voices: damped (freq, decay, amp) partials plus a noise layer.
+# The distant step rings under an exp(-reverb·t) tail; the player's own
+# steps are carpet noise, box-filtered (kernel + turn·shear taps) under a
+# linear attack/release and smeared slightly across the stereo field.
+_FOOTSTEP_PARAMS = {
+    # Ambient footstep (distant)
+    "ambient": dict(duration=0.3, components=((80, 20, 1.0), (120, 15, 0.5)),
+                    noise_mix=0.1 * 0.3, gain=0.7, reverb=5),
+    # Deep, soft carpet footstep (pressure into fabric)
+    "player": dict(duration=0.14, components=((38, 18, 0.08), (28, 18, 0.04)),
+                   noise_mix=0.3, gain=0.32, attack=0.35, kernel=(65, 25), smear=0.08),
+    # Ultra-soft crouch footstep (slow pressure, strong absorption)
+    "crouch": dict(duration=0.18, components=((32, 14, 0.06), (24, 14, 0.03)),
+                   noise_mix=0.25, gain=0.24, attack=0.45, kernel=(80, 30), smear=0.06),
+}
+
+
+def _synth_footstep(duration, components, noise_mix, gain, reverb=None,
+                    attack=None, kernel=None, smear=0.0, turn_factor=0.0):
+    samples = int(SAMPLE_RATE * duration)
+    freqs, decays, amps = zip(*components)
+    # Work in (N, channels) columns so mono and stereo layers broadcast
+    sound = _partials(samples, freqs, amps, decays=decays)[:, None]
+
+    if reverb is not None:
+        # Gaussian tail decaying as exp(-reverb·t), drawn per channel
+        noise_shape = (samples, 2)
+    else:
+        noise_shape = (samples, 1)
+
+    with _scratch(noise_shape) as noise:
+        if reverb is not None:
+            envelope = _decay_envelope(samples, reverb)
+            layer = _RNG.standard_normal(dtype=np.float32, out=noise)
+        else:
+            # Soft envelope: linear rise over `attack` of the step, then release
+            envelope = _attack_release(samples, int(attack * samples))[:, None]
+            # Fabric noise, uniform in [-1, 1), muffled more when turning
+            _RNG.random(dtype=np.float32, out=noise)
+            noise *= 2
+            noise -= 1
+            base, shear = kernel
+            layer = low_pass(noise[:, 0], kernel_size=int(base + turn_factor * shear))[:, None]
+
+        layer *= envelope
+        layer *= noise_mix
+        layer += sound
+
+        # Subtle stereo smear (body rotation, not panning)
+        return _freeze(_to_stereo_int16(layer, gain, balance=turn_factor * smear))
+
+
+@lru_cache(maxsize=None)
+@_disk_cached(params=lambda voice, turn_factor=0.0: sorted(_FOOTSTEP_PARAMS[voice].items()),
+              uses=(_synth_footstep,))
+def _footstep_samples(voice, turn_factor=0.0):
+    return _synth_footstep(turn_factor=turn_factor, **_FOOTSTEP_PARAMS[voice])
 
-    # Deep, slow pressure (almost sub-audible)
-    bass = (
-        0.06 * np.sin(2 * np.pi * 32 * t) +
-        0.03 * np.sin(2 * np.pi * 24 * t)
-    ) * np.exp(-t * 14)
 
-    sound = muffled * envelope * 0.25 + bass
+def generate_footstep_sound():
+    """Generate ambient footstep sound (distant)."""
+    return pygame.sndarray.make_sound(_footstep_samples("ambient"))
 
-    # Very low output level
-    sound = sound / np.max(np.abs(sound)) * 0.24
 
-    # Extremely subtle stereo drift
-    left = sound * (1.0 - turn_factor * 0.06)
-    right = sound * (1.0 + turn_factor * 0.06)
+def generate_player_footstep_sound(turn_factor=1.0):
+    """Generate deep, soft carpet footstep (pressure into fabric).
+    turn_factor: 0.0 (straight) → 1.0 (hard turn)
+    """
+    # Clamp for safety (also keeps the sample cache small)
+    turn_factor = max(0.0, min(turn_factor, 1.0))
+    return pygame.sndarray.make_sound(_footstep_samples("player", turn_factor))
 
-    audio_l = np.array(left * 32767, dtype=np.int16)
-    audio_r = np.array(right * 32767, dtype=np.int16)
-    stereo_audio = np.column_stack((audio_l, audio_r))
 
-    return pygame.sndarray.make_sound(stereo_audio)
+def generate_crouch_footstep_sound(turn_factor=1.0):
+    """Generate ultra-soft, deep carpet crouch footstep (slow pressure).
+    turn_factor: 0.0 (straight) → 1.0 (hard turn)
+    """
+    turn_factor = max(0.0, min(turn_factor, 1.0))
+    return pygame.sndarray.make_sound(_footstep_samples("crouch", turn_factor))
 
 
-def generate_electrical_buzz():
-    """Generate electrical buzzing sound."""
+@lru_cache(maxsize=None)
+@_disk_cached()
+def _electrical_buzz_samples():
     duration = 1.5
     samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, samples, False)
 
-    buzz = 0.2 * np.sin(2 * np.pi * 120 * t)
-    buzz += 0.15 * np.sin(2 * np.pi * 240 * t)
-    mod = np.sin(2 * np.pi * 8 * t) * 0.5 + 0.5
-    buzz *= mod
+    # 120/240 Hz hum chopped by 0.5 + 0.5·sin(2π·8·t)
+    freqs, amps, phases = _modulated((120, 240), (0.2, 0.15), 8)
+    buzz = _partials(samples, freqs, amps, phases=phases)
 
-    buzz = buzz / np.max(np.abs(buzz)) * 0.3
-    audio = np.array(buzz * 32767, dtype=np.int16)
-    stereo_audio = np.column_stack((audio, audio))
+    return _freeze(_to_stereo_int16(buzz, 0.3))
 
-    return pygame.sndarray.make_sound(stereo_audio)
 
+def generate_electrical_buzz():
+    """Generate electrical buzzing sound."""
+    return pygame.sndarray.make_sound(_electrical_buzz_samples())
 
-def generate_destroy_sound():
-    """Generate destruction sound for walls breaking."""
+
+@lru_cache(maxsize=None)
+@_disk_cached()
+def _destroy_samples():
     duration = 1.0
     samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, samples, False)
-
     # Big impact
-    impact = np.exp(-t * 8) * np.sin(2 * np.pi * 80 * t)
-    impact += np.exp(-t * 10) * np.sin(2 * np.pi * 120 * t) * 0.8
+    sound = _partials(samples, (80, 120), (1.0, 0.8), decays=(8, 10))
 
-    # Crumbling/debris
-    crumble = np.random.normal(0, 0.4, samples) * np.exp(-t * 4)
+    # Crumbling/debris, mixed in at 0.7, scattered independently per channel
+    with _scratch((samples, 2)) as crumble:
+        _RNG.standard_normal(dtype=np.float32, out=crumble)
+        crumble *= _decay_envelope(samples, 4)
+        crumble *= 0.4 * 0.7
+        crumble += sound[:, None]
+        return _freeze(_to_stereo_int16(crumble, 0.8))
 
-    sound = impact + crumble * 0.7
-    sound = sound / np.max(np.abs(sound)) * 0.8
 
-    audio = np.array(sound * 32767, dtype=np.int16)
-    stereo_audio = np.column_stack((audio, audio))
+def generate_destroy_sound():
+    """Generate destruction sound for walls breaking."""
+    return pygame.sndarray.make_sound(_destroy_samples())
+
+
+class LazySound:
+    """Stand-in for a pygame Sound that is only synthesized on first use.
+
+    Any Sound method (play, set_volume, ...) builds the real Sound once via
+    generate(*args) and delegates to it; stop() on a sound that was never
+    built is a no-op. Safe to first touch from more than one thread.
+    """
+
+    def __init__(self, generate, *args):
+        self._generate = generate
+        self._args = args
+        self._sound = None
+        self._lock = threading.Lock()
+
+    @property
+    def sound(self):
+        if self._sound is None:
+            with self._lock:
+                if self._sound is None:
+                    self._sound = self._generate(*self._args)
+        return self._sound
+
+    def stop(self):
+        if self._sound is not None:
+            self._sound.stop()
+
+    def __getattr__(self, name):
+        return getattr(self.sound, name)
+
+
+def prefetch_sounds(sounds):
+    """Synthesize LazySounds on a daemon thread so the work overlaps startup.
+
+    No join is needed: a sound used before the thread reaches it is built
+    on the spot, and one the thread is building blocks on its lock.
+    """
+    def build():
+        for sound in sounds:
+            sound.sound
 
-    return pygame.sndarray.make_sound(stereo_audio)
+    thread = threading.Thread(target=build, name="sound-prefetch", daemon=True)
+    thread.start()
+    return thread
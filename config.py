@@ -8,6 +8,7 @@ WIDTH = 960
 HEIGHT = 540
 FULLSCREEN = True
 FPS = 60
+MENU_FPS = 30  # MENU/PAUSED show a frozen frame, no need to run at full rate
 
 # Performance settings
 RENDER_SCALE = 1
@@ -28,6 +29,7 @@ ROTATION_SPEED = 2.0
 WALK_SPEED = 50
 RUN_SPEED = 100
 CROUCH_SPEED = 10
+PLAYER_RADIUS = 15.0
 
 # Camera heights
 CAMERA_HEIGHT_STAND = 50
@@ -74,6 +76,10 @@ FOG_START = 200
 FOG_END = 350
 FOG_COLOR = (20, 40, 80)
 
+# Debris settings
+MAX_DEBRIS = 12000
+DEBRIS_CULL_DIST = 900.0
+
 # Flickering settings
 FLICKER_CHANCE = 0.0003
 FLICKER_DURATION = 0.08
@@ -86,6 +92,7 @@ BUZZ_INTERVAL = (5, 15)
 # Audio settings
 SAMPLE_RATE = 22050
 AUDIO_BUFFER_SIZE = 2048
+SOUND_CACHE_DIR = "backrooms_sound_cache"  # synthesized sample buffers, reused across runs
 
 # Texture settings
 TEXTURE_SIZE = 256
@@ -1,7 +1,7 @@
 """
 Debris physics + structural failure system.
 Includes:
-- Pixel debris
+- Pixel debris (single pieces and the ring-buffered DebrisField)
 - Cracks
 - Stress accumulation
 - Leaning walls
@@ -12,6 +12,9 @@ Includes:
 import random
 import math
 from enum import Enum
+
+import numpy as np
+
 from config import NEAR
 
 
@@ -120,6 +123,170 @@ class Debris:
         return engine.project_camera(cam_pos)
 
 
+# ============================================================
+# PIXEL DEBRIS FIELD (structure of arrays)
+# ============================================================
+
+class DebrisField:
+    """
+    All pixel debris as parallel NumPy arrays in a fixed-size ring buffer,
+    one slot per piece. Same physics as Debris, stepped for every piece at
+    once. Dead pieces are only flagged inactive; their slots are reclaimed
+    by a compaction pass about once a second, or when a spawn needs room.
+    When the ring is full of live pieces, new ones overwrite the oldest.
+    """
+
+    # Single precision is plenty for pixel-sized pieces and halves the
+    # memory every per-frame pass streams through
+    FIELDS = {
+        'pos': ((3,), np.float32), 'vel': ((3,), np.float32), 'color': ((3,), np.uint8),
+        'active': ((), bool), 'settled': ((), bool), 'settle_timer': ((), np.float32),
+        'age': ((), np.float32), 'settled_age': ((), np.float32), 'max_age': ((), np.float32),
+        'max_settled_age': ((), np.float32),
+    }
+    COMPACT_INTERVAL = 1.0
+
+    def __init__(self, capacity=12000):
+        self.capacity = capacity
+        self.head = 0    # slot of the oldest piece
+        self.count = 0   # slots in use from head, live or dead
+        self._since_compact = 0.0
+        self.rng = np.random.default_rng()
+        for name, (shape, dtype) in self.FIELDS.items():
+            setattr(self, name, np.zeros((capacity,) + shape, dtype=dtype))
+
+    def __len__(self):
+        return int(np.count_nonzero(self.active))
+
+    def live(self):
+        """Slot indices of live pieces, oldest first."""
+        order = self._ring_slots()
+        return order[self.active[order]]
+
+    def _ring_slots(self):
+        return (self.head + np.arange(self.count)) % self.capacity
+
+    def spawn(self, positions, colors, velocities=None):
+        """Add pieces; without velocities they start settled (rubble)."""
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        colors = np.broadcast_to(colors, positions.shape)
+        if velocities is not None:
+            velocities = np.broadcast_to(velocities, positions.shape)
+
+        # More than fits: only the newest survive anyway
+        k = len(positions)
+        if k > self.capacity:
+            positions, colors = positions[-self.capacity:], colors[-self.capacity:]
+            if velocities is not None:
+                velocities = velocities[-self.capacity:]
+            k = self.capacity
+        if k == 0:
+            return
+
+        if self.count + k > self.capacity:
+            self._compact()
+        overflow = self.count + k - self.capacity
+        if overflow > 0:
+            # Still full of live pieces: overwrite the oldest
+            self.active[self._ring_slots()[:overflow]] = False
+            self.head = (self.head + overflow) % self.capacity
+            self.count -= overflow
+
+        rows = (self.head + self.count + np.arange(k)) % self.capacity
+        self.pos[rows] = positions
+        self.color[rows] = colors
+        if velocities is None:
+            self.vel[rows] = 0.0
+            self.settled[rows] = True
+        else:
+            self.vel[rows] = velocities
+            self.settled[rows] = False
+        self.active[rows] = True
+        self.settle_timer[rows] = 0.0
+        self.age[rows] = 0.0
+        self.settled_age[rows] = 0.0
+        self.max_age[rows] = self.rng.uniform(8.0, 18.0, k)
+        self.max_settled_age[rows] = self.rng.uniform(2.0, 6.0, k)
+        self.count += k
+
+    def update(self, dt, floor_y, cull_center=None, cull_dist=None):
+        """
+        Step every live piece, then retire expired ones and ones farther
+        than cull_dist from cull_center (x, z).
+        """
+        if self.count == 0:
+            return
+
+        # Views over the slots in use (the whole buffer once the ring wraps)
+        end = self.head + self.count
+        used = slice(self.head, end) if end <= self.capacity else slice(None)
+        active, settled = self.active[used], self.settled[used]
+        pos, vel = self.pos[used], self.vel[used]
+        age, settled_age = self.age[used], self.settled_age[used]
+        settle_timer = self.settle_timer[used]
+
+        age[active] += dt
+        dead = active & (age > self.max_age[used])
+
+        # Settled pieces only age out
+        resting = active & ~dead & settled
+        settled_age[resting] += dt
+        dead |= resting & (settled_age > self.max_settled_age[used])
+
+        moving = np.flatnonzero(active & ~dead & ~settled)
+        if moving.size:
+            v = vel[moving]
+            p = pos[moving]
+            v[:, 1] -= 40 * dt
+            p += v * dt
+
+            grounded = p[:, 1] <= floor_y
+            p[grounded, 1] = floor_y
+            v[grounded, 1] *= -0.1
+            v[grounded, 0] *= 0.6
+            v[grounded, 2] *= 0.6
+
+            speed_sq = np.einsum('ij,ij->i', v, v)
+            slow = (speed_sq < 0.25) & (np.abs(p[:, 1] - floor_y) < 0.5)
+            timers = settle_timer[moving]
+            timers[slow] += dt
+            settle_timer[moving] = timers
+
+            settle = slow & (timers > 0.3)
+            v[settle] = 0.0
+            p[settle, 1] = floor_y
+            vel[moving] = v
+            pos[moving] = p
+            if settle.any():
+                newly = moving[settle]
+                settled[newly] = True
+                settled_age[newly] = 0.0
+
+        if cull_dist is not None:
+            dx = pos[:, 0] - cull_center[0]
+            dz = pos[:, 2] - cull_center[1]
+            dead |= active & ((dx * dx + dz * dz) > cull_dist * cull_dist)
+
+        active &= ~dead
+
+        self._since_compact += dt
+        if self._since_compact >= self.COMPACT_INTERVAL:
+            self._compact()
+
+    def _compact(self):
+        """Move live pieces to the front of the buffer, oldest first."""
+        keep = self.live()
+        k = keep.size
+        if k != self.count or self.head != 0:
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[:k] = array[keep]
+            self.active[k:] = False
+        self.head = 0
+        self.count = k
+        self._since_compact = 0.0
+
+
 # ============================================================
 # RUBBLE CHUNKS (heavy, persistent)
 # ============================================================
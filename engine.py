@@ -9,11 +9,40 @@ import numpy as np
 import pygame
 
 from config import *
-from debris import Debris
+from debris import DebrisField
 from procedural import ProceduralZone
 from textures import (generate_carpet_texture, generate_ceiling_tile_texture,
                       generate_wall_texture, generate_pillar_texture)
-from raycasting import ray_intersects_triangle
+from raycasting import nearest_ray_hit
+
+# Wall keys pack (grid x, grid z, horizontal) of the wall's min corner into
+# one int: 21 bits per axis, biased so negative grid indices stay positive.
+_KEY_AXIS_BITS = 21
+_KEY_BIAS = 1 << (_KEY_AXIS_BITS - 1)
+_KEY_MASK = (1 << _KEY_AXIS_BITS) - 1
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(seed):
+    """splitmix64 finalizer: a well-mixed 64-bit hash of an int seed."""
+    s = (seed * 0x9E3779B97F4A7C15) & _MASK64
+    s ^= s >> 30
+    s = (s * 0xBF58476D1CE4E5B9) & _MASK64
+    s ^= s >> 27
+    s = (s * 0x94D049BB133111EB) & _MASK64
+    return s ^ (s >> 31)
+
+
+def _hash01(seed):
+    """Deterministic float in [0, 1) for an int seed."""
+    return _mix64(seed) / 2 ** 64
+
+
+_HALF_THICK = WALL_THICKNESS / 2
+
+# Render queue item kinds
+_FLOOR, _CEILING, _PILLAR, _WALL_H, _WALL_V = range(5)
 
 
 class BackroomsEngine:
@@ -47,20 +76,29 @@ class BackroomsEngine:
         self.pillar_cache = {}
         self.wall_cache = {}
         self.zone_cache = {}
+        self._wall_index = {}  # (px, pz) -> (h_key, v_key, h_opening, v_opening, h_damage, v_damage)
+        self._span_index = {}  # (px, pz) -> (h_spans, v_spans), destruction applied
+        self._tri_cache = {}  # ('wall' | 'pillar', key) -> (N, 3, 3) targeting triangles
+        self._visible_cells_cache = {}  # 'tile' | 'pillar' | 'wall' -> ((bounds, gen), cells)
+        self._destruction_gen = 0  # bumped whenever a wall or pillar is destroyed
+        self._target_cache = None  # (camera pose + destruction gen, last targeting result)
 
         # Destruction system
         self.destroyed_walls = set()
         self.destroyed_pillars = set()
         self.pre_damaged_walls = {}  # wall_key -> damage_state (0.0-1.0)
-        self.debris_pieces = []
+        self.debris = DebrisField(capacity=MAX_DEBRIS)
+        self._rng = np.random.default_rng()
+        # Own stream for ambience and effects, apart from the global random module
+        self._py_rng = random.Random()
         self._spawned_rubble = set()
 
         # Animation
         self.head_bob_time = 0
         self.is_moving = False
         self.is_rotating = False
-        self.camera_shake_time = random.random() * 100
-        self.last_footstep_phase = 0
+        self.camera_shake_time = self._py_rng.random() * 100
+        self._last_step_idx = 0
 
         # Movement states
         self.is_running = False
@@ -78,8 +116,8 @@ class BackroomsEngine:
         self.flicker_brightness = 1.0
 
         # Ambient sounds
-        self.next_footstep = random.uniform(*FOOTSTEP_INTERVAL)
-        self.next_buzz = random.uniform(*BUZZ_INTERVAL)
+        self.next_footstep = self._py_rng.uniform(*FOOTSTEP_INTERVAL)
+        self.next_buzz = self._py_rng.uniform(*BUZZ_INTERVAL)
         self.sound_timer = 0
 
         # Stats
@@ -89,11 +127,18 @@ class BackroomsEngine:
         self.render_scale = RENDER_SCALE
         self.target_render_scale = RENDER_SCALE
         self.render_scale_transition_speed = 2.0
+        self.smooth_upscale = False  # bilinear instead of nearest upscale below 1.0x
         self.render_surface = None
         self.update_render_surface()
+        self._poly_queue = []
+        self._refresh_scaled_heights()
+
+        # Startup messages are held until the first frame is on screen,
+        # see flush_startup_log()
+        self.startup_log = []
 
         # Generate textures
-        print("Generating procedural textures...")
+        self.startup_log.append("Generating procedural textures...")
         self.carpet_texture = generate_carpet_texture()
         self.ceiling_texture = generate_ceiling_tile_texture()
         self.wall_texture = generate_wall_texture()
@@ -104,13 +149,18 @@ class BackroomsEngine:
         self.wall_avg = self._get_average_color(self.wall_texture)
         self.pillar_avg = self._get_average_color(self.pillar_texture)
 
-        print(f"World seed: {self.world_seed}")
-        print("Textures generated!")
+        self.startup_log.append(f"World seed: {self.world_seed}")
+        self.startup_log.append("Textures generated!")
+
+    def flush_startup_log(self):
+        """Print and clear the messages collected during construction."""
+        if self.startup_log:
+            print("\n".join(self.startup_log))
+            self.startup_log.clear()
 
     def _get_average_color(self, surface):
         """Extract average color from a surface."""
-        arr = pygame.surfarray.array3d(surface)
-        return tuple(int(arr[:, :, i].mean()) for i in range(3))
+        return tuple(pygame.transform.average_color(surface)[:3])
 
     # === RENDER SCALING ===
 
@@ -119,6 +169,11 @@ class BackroomsEngine:
         render_height = int(self.height * self.render_scale)
         self.render_surface = pygame.Surface((render_width, render_height))
 
+        # Projection constants for the render surface (render() draws at its size)
+        FOV_ANGLE = 90  # degrees
+        self._focal = (render_width * 0.5) / math.tan(math.radians(FOV_ANGLE * 0.5))
+        self._aspect = render_height / render_width
+
     def toggle_render_scale(self):
         if self.target_render_scale == 1.0:
             self.target_render_scale = 0.5
@@ -141,6 +196,13 @@ class BackroomsEngine:
                 self.render_scale = self.target_render_scale
                 self.update_render_surface()
 
+    def _refresh_scaled_heights(self):
+        """Read the scaled heights from config once, for update() and render() to share."""
+        self._wall_h = get_scaled_wall_height()
+        self._floor_y = get_scaled_floor_y()
+        self._bob_amount = get_scaled_head_bob_amount()
+        self._bob_sway = get_scaled_head_bob_sway()
+
     # === ZONE SYSTEM ===
 
     def get_zone_at(self, x, z):
@@ -187,105 +249,154 @@ class BackroomsEngine:
 
         return ray_origin, ray_dir
 
+    def _ray_cells(self, ray_origin, ray_dir, max_distance):
+        """Grid cells (x, z corner) the ray's ground shadow crosses within max_distance.
+
+        Amanatides–Woo grid walk; distances are along the 3D ray.
+        """
+        S = PILLAR_SPACING
+        ox, oz = float(ray_origin[0]), float(ray_origin[2])
+        dx, dz = float(ray_dir[0]), float(ray_dir[2])
+
+        cx = math.floor(ox / S)
+        cz = math.floor(oz / S)
+        step_x = 1 if dx > 0 else -1
+        step_z = 1 if dz > 0 else -1
+
+        if dx != 0:
+            next_x = ((cx + (dx > 0)) * S - ox) / dx
+            delta_x = S / abs(dx)
+        else:
+            next_x = delta_x = math.inf
+        if dz != 0:
+            next_z = ((cz + (dz > 0)) * S - oz) / dz
+            delta_z = S / abs(dz)
+        else:
+            next_z = delta_z = math.inf
+
+        cells = [(cx * S, cz * S)]
+        while min(next_x, next_z) <= max_distance:
+            if next_x < next_z:
+                cx += step_x
+                next_x += delta_x
+            else:
+                cz += step_z
+                next_z += delta_z
+            cells.append((cx * S, cz * S))
+        return cells
+
     def find_targeted_wall_or_pillar(self):
-        """Find wall segment or pillar being looked at."""
+        """Find wall segment or pillar being looked at.
+
+        The answer only changes when the camera moves or something is
+        destroyed, so repeat calls from the same pose (click and E in one
+        frame, key repeat while standing still) reuse the last ray cast.
+        """
+        pose = (self.x_s, self.y_s, self.z_s, self.yaw_s, self.pitch_s, self._destruction_gen)
+        if self._target_cache is not None and self._target_cache[0] == pose:
+            return self._target_cache[1]
+        target = self._cast_target_ray()
+        self._target_cache = (pose, target)
+        return target
+
+    def _cast_target_ray(self):
+        """Nearest intact wall or pillar hit by the screen-centre ray, or None."""
         ray_origin, ray_dir = self.get_ray_from_screen_center()
         max_distance = 100
+        S = PILLAR_SPACING
+
+        # Only cells the ray actually crosses can hold the hit. A cell's
+        # candidates are the wall faces touching it (faces sit half a wall
+        # thickness toward -z / -x of their grid line, and may touch the
+        # cell at its corners) plus its own pillar.
+        h_corners = set()
+        v_corners = set()
+        pillar_cells = set()
+        for cx, cz in self._ray_cells(ray_origin, ray_dir, max_distance):
+            for dx in (-S, 0, S):
+                h_corners.add((cx + dx, cz + S))
+            for dz in (-S, 0, S):
+                v_corners.add((cx + S, cz + dz))
+            pillar_cells.add((cx, cz))
+
+        # Gather every candidate's triangles, tagged with what they belong
+        # to, then test them all against the ray in one batch. Candidates keep
+        # the grid-scan order (walls, then pillars) so ties resolve as before.
+        candidates = []
+
+        for px, pz in sorted(h_corners | v_corners):
+            h_key, v_key = self._cell_walls(px, pz)[:2]
+
+            if h_key is not None and (px, pz) in h_corners and h_key not in self.destroyed_walls:
+                candidates.append(('wall', h_key))
+            if v_key is not None and (px, pz) in v_corners and v_key not in self.destroyed_walls:
+                candidates.append(('wall', v_key))
+
+        offset = S // 2
+        for px, pz in sorted(pillar_cells):
+            pillar_x = px + offset
+            pillar_z = pz + offset
+
+            if self._get_pillar_at(pillar_x, pillar_z):
+                pillar_key = (pillar_x, pillar_z)
+                if pillar_key not in self.destroyed_pillars:
+                    candidates.append(('pillar', pillar_key))
 
-        closest_hit = None
-        closest_dist = float('inf')
-        hit_type = None
-
-        render_range = 200
-        start_x = int((self.x_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        end_x = int((self.x_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        start_z = int((self.z_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        end_z = int((self.z_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING
-
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
-
-        # Check walls (existing code)
-        for px in range(start_x, end_x + PILLAR_SPACING, PILLAR_SPACING):
-            for pz in range(start_z, end_z + PILLAR_SPACING, PILLAR_SPACING):
-                # Horizontal walls
-                if self._has_wall_between(px, pz, px + PILLAR_SPACING, pz):
-                    wall_key = tuple(sorted([(px, pz), (px + PILLAR_SPACING, pz)]))
-                    if wall_key not in self.destroyed_walls:
-                        half_thick = WALL_THICKNESS / 2
-                        z = pz
-                        x1, x2 = px, px + PILLAR_SPACING
-
-                        v0 = (x1, h, z - half_thick)
-                        v1 = (x2, h, z - half_thick)
-                        v2 = (x2, floor_y, z - half_thick)
-                        v3 = (x1, floor_y, z - half_thick)
-
-                        for tri in [(v0, v1, v2), (v0, v2, v3)]:
-                            hit = ray_intersects_triangle(ray_origin, ray_dir, *tri)
-                            if hit and hit[0] < max_distance and hit[0] < closest_dist:
-                                closest_dist = hit[0]
-                                closest_hit = wall_key
-                                hit_type = 'wall'
-
-                # Vertical walls
-                if self._has_wall_between(px, pz, px, pz + PILLAR_SPACING):
-                    wall_key = tuple(sorted([(px, pz), (px, pz + PILLAR_SPACING)]))
-                    if wall_key not in self.destroyed_walls:
-                        half_thick = WALL_THICKNESS / 2
-                        x = px
-                        z1, z2 = pz, pz + PILLAR_SPACING
-
-                        v0 = (x - half_thick, h, z1)
-                        v1 = (x - half_thick, h, z2)
-                        v2 = (x - half_thick, floor_y, z2)
-                        v3 = (x - half_thick, floor_y, z1)
-
-                        for tri in [(v0, v1, v2), (v0, v2, v3)]:
-                            hit = ray_intersects_triangle(ray_origin, ray_dir, *tri)
-                            if hit and hit[0] < max_distance and hit[0] < closest_dist:
-                                closest_dist = hit[0]
-                                closest_hit = wall_key
-                                hit_type = 'wall'
-
-        # Check pillars (NEW CODE)
-        offset = PILLAR_SPACING // 2
-        for px in range(start_x, end_x + PILLAR_SPACING, PILLAR_SPACING):
-            for pz in range(start_z, end_z + PILLAR_SPACING, PILLAR_SPACING):
-                pillar_x = px + offset
-                pillar_z = pz + offset
-
-                if self._get_pillar_at(pillar_x, pillar_z):
-                    pillar_key = (pillar_x, pillar_z)
-                    if pillar_key not in self.destroyed_pillars:
-                        s = PILLAR_SIZE
-
-                        # Check all 4 faces
-                        faces = [
-                            [(pillar_x, h, pillar_z), (pillar_x + s, h, pillar_z),
-                             (pillar_x + s, floor_y, pillar_z), (pillar_x, floor_y, pillar_z)],
-                            [(pillar_x + s, h, pillar_z + s), (pillar_x, h, pillar_z + s),
-                             (pillar_x, floor_y, pillar_z + s), (pillar_x + s, floor_y, pillar_z + s)],
-                            [(pillar_x, h, pillar_z), (pillar_x, h, pillar_z + s),
-                             (pillar_x, floor_y, pillar_z + s), (pillar_x, floor_y, pillar_z)],
-                            [(pillar_x + s, h, pillar_z + s), (pillar_x + s, h, pillar_z),
-                             (pillar_x + s, floor_y, pillar_z), (pillar_x + s, floor_y, pillar_z + s)]
-                        ]
-
-                        for face in faces:
-                            v0, v1, v2, v3 = face
-                            for tri in [(v0, v1, v2), (v0, v2, v3)]:
-                                hit = ray_intersects_triangle(ray_origin, ray_dir, *tri)
-                                if hit and hit[0] < max_distance and hit[0] < closest_dist:
-                                    closest_dist = hit[0]
-                                    closest_hit = pillar_key
-                                    hit_type = 'pillar'
-
-        if closest_hit:
-            return (hit_type, closest_hit)
+        if not candidates:
+            return None
+        tris = [self._target_triangles(owner) for owner in candidates]
+        owners = [owner for owner, t in zip(candidates, tris) for _ in range(len(t))]
+        triangles = np.concatenate(tris)
+
+        # First (nearest) hit wins, earliest candidate on ties
+        hit = nearest_ray_hit(ray_origin, ray_dir, triangles, max_distance)
+        if hit:
+            return owners[hit[0]]
         return None
 
 
+    def _target_triangles(self, owner):
+        """
+        (N, 3, 3) targeting triangles for ('wall', key) or ('pillar', key),
+        built on first use: a wall's front face, or a pillar's four faces.
+        """
+        tris = self._tri_cache.get(owner)
+        if tris is None:
+            kind, key = owner
+            h = self._wall_h
+            floor_y = self._floor_y
+
+            if kind == 'wall':
+                # Faces sit half a wall thickness toward -z / -x
+                (x1, z1), (x2, z2) = self._decode_key(key)
+                if z1 == z2:
+                    z = z1 - _HALF_THICK
+                    faces = [[(x1, h, z), (x2, h, z), (x2, floor_y, z), (x1, floor_y, z)]]
+                else:
+                    x = x1 - _HALF_THICK
+                    faces = [[(x, h, z1), (x, h, z2), (x, floor_y, z2), (x, floor_y, z1)]]
+            else:
+                pillar_x, pillar_z = key
+                s = PILLAR_SIZE
+                faces = [
+                    [(pillar_x, h, pillar_z), (pillar_x + s, h, pillar_z),
+                     (pillar_x + s, floor_y, pillar_z), (pillar_x, floor_y, pillar_z)],
+                    [(pillar_x + s, h, pillar_z + s), (pillar_x, h, pillar_z + s),
+                     (pillar_x, floor_y, pillar_z + s), (pillar_x + s, floor_y, pillar_z + s)],
+                    [(pillar_x, h, pillar_z), (pillar_x, h, pillar_z + s),
+                     (pillar_x, floor_y, pillar_z + s), (pillar_x, floor_y, pillar_z)],
+                    [(pillar_x + s, h, pillar_z + s), (pillar_x + s, h, pillar_z),
+                     (pillar_x + s, floor_y, pillar_z), (pillar_x + s, floor_y, pillar_z + s)]
+                ]
+
+            triangles = []
+            for v0, v1, v2, v3 in faces:
+                triangles += [(v0, v1, v2), (v0, v2, v3)]
+            tris = np.array(triangles, dtype=float)
+            tris.setflags(write=False)
+            self._tri_cache[owner] = tris
+        return tris
+
     # === WALL DESTRUCTION ===
 
     def destroy_wall(self, wall_key, destroy_sound):
@@ -294,21 +405,22 @@ class BackroomsEngine:
             return
 
         self.destroyed_walls.add(wall_key)
+        self._destruction_gen += 1
         destroy_sound.play()
 
-        (x1, z1), (x2, z2) = wall_key
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
-        half_thick = WALL_THICKNESS / 2
+        (x1, z1), (x2, z2) = self._decode_key(wall_key)
+        self._span_index.pop((x1, z1), None)
+        h = self._wall_h
+        floor_y = self._floor_y
 
         # Determine wall bounds
         if x1 == x2:  # Vertical wall
             x = x1
-            min_x, max_x = x - half_thick, x + half_thick
+            min_x, max_x = x - _HALF_THICK, x + _HALF_THICK
             min_z, max_z = min(z1, z2), max(z1, z2)
         else:  # Horizontal wall
             z = z1
-            min_z, max_z = z - half_thick, z + half_thick
+            min_z, max_z = z - _HALF_THICK, z + _HALF_THICK
             min_x, max_x = min(x1, x2), max(x1, x2)
 
         min_y, max_y = floor_y, h
@@ -317,35 +429,7 @@ class BackroomsEngine:
         base = 1200
         num_particles = max(250, int(base * (1.0 / (1.0 + len(self.destroyed_walls) / 20))))
 
-        for i in range(num_particles):
-            px = random.uniform(min_x, max_x)
-            py = random.uniform(min_y, max_y)
-            pz = random.uniform(min_z, max_z)
-
-            center_x = (min_x + max_x) / 2
-            center_z = (min_z + max_z) / 2
-
-            dx = px - center_x
-            dz = pz - center_z
-            dist = math.sqrt(dx ** 2 + dz ** 2) + 0.1
-
-            speed = random.uniform(8, 20)
-            vx = (dx / dist) * speed + random.uniform(-3, 3)
-            vy = random.uniform(-20, -5)
-            vz = (dz / dist) * speed + random.uniform(-3, 3)
-
-            color_var = random.randint(-30, 30)
-            particle_color = (
-                max(0, min(255, WALL_COLOR[0] + color_var)),
-                max(0, min(255, WALL_COLOR[1] + color_var)),
-                max(0, min(255, WALL_COLOR[2] + color_var))
-            )
-
-            self.debris_pieces.append(Debris(
-                (px, py, pz),
-                particle_color,
-                velocity=(vx, vy, vz)
-            ))
+        self._spawn_burst(min_x, max_x, min_y, max_y, min_z, max_z, num_particles, WALL_COLOR)
 
     def destroy_pillar(self, pillar_key, destroy_sound):
         """Destroy a pillar and create debris."""
@@ -353,12 +437,13 @@ class BackroomsEngine:
             return
 
         self.destroyed_pillars.add(pillar_key)
+        self._destruction_gen += 1
         destroy_sound.play()
 
         pillar_x, pillar_z = pillar_key
         s = PILLAR_SIZE
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
+        h = self._wall_h
+        floor_y = self._floor_y
 
         min_x, max_x = pillar_x, pillar_x + s
         min_z, max_z = pillar_z, pillar_z + s
@@ -367,49 +452,41 @@ class BackroomsEngine:
         base = 1200
         num_particles = max(250, int(base * (1.0 / (1.0 + len(self.destroyed_pillars) / 20))))
 
-        for i in range(num_particles):
-            px = random.uniform(min_x, max_x)
-            py = random.uniform(min_y, max_y)
-            pz = random.uniform(min_z, max_z)
-
-            center_x = (min_x + max_x) / 2
-            center_z = (min_z + max_z) / 2
-
-            dx = px - center_x
-            dz = pz - center_z
-            dist = math.sqrt(dx ** 2 + dz ** 2) + 0.1
-
-            speed = random.uniform(8, 20)
-            vx = (dx / dist) * speed + random.uniform(-3, 3)
-            vy = random.uniform(-20, -5)
-            vz = (dz / dist) * speed + random.uniform(-3, 3)
-
-            color_var = random.randint(-30, 30)
-            particle_color = (
-                max(0, min(255, PILLAR_COLOR[0] + color_var)),
-                max(0, min(255, PILLAR_COLOR[1] + color_var)),
-                max(0, min(255, PILLAR_COLOR[2] + color_var))
-            )
-
-            self.debris_pieces.append(Debris(
-                (px, py, pz),
-                particle_color,
-                velocity=(vx, vy, vz)
-            ))
+        self._spawn_burst(min_x, max_x, min_y, max_y, min_z, max_z, num_particles, PILLAR_COLOR)
+
+    def _spawn_burst(self, min_x, max_x, min_y, max_y, min_z, max_z, count, base_color):
+        """Spawn debris flying outward from the centre of a destroyed box."""
+        rng = self._rng
+        pos = rng.uniform((min_x, min_y, min_z), (max_x, max_y, max_z), size=(count, 3))
+
+        # Outward from the box centre on the floor plane, plus some scatter
+        d = pos[:, ::2] - ((min_x + max_x) / 2, (min_z + max_z) / 2)
+        dist = np.hypot(d[:, 0], d[:, 1]) + 0.1
+        speed = rng.uniform(8, 20, count)
+        vel = np.empty((count, 3))
+        vel[:, ::2] = d * (speed / dist)[:, None] + rng.uniform(-3, 3, (count, 2))
+        vel[:, 1] = rng.uniform(-20, -5, count)
+
+        color_var = rng.integers(-30, 31, (count, 1))
+        colors = np.clip(np.add(base_color, color_var), 0, 255)
+
+        self.debris.spawn(pos, colors, vel)
+
     # === SOUND SYSTEM ===
 
     def update_sounds(self, dt, sound_effects):
         self.sound_timer += dt
+        rng = self._py_rng
 
         if self.sound_timer >= self.next_footstep:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = rng.uniform(0, 2 * math.pi)
             self.play_directional_sound(sound_effects['footstep'], angle)
-            self.next_footstep = self.sound_timer + random.uniform(*FOOTSTEP_INTERVAL)
+            self.next_footstep = self.sound_timer + rng.uniform(*FOOTSTEP_INTERVAL)
 
         if self.sound_timer >= self.next_buzz:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = rng.uniform(0, 2 * math.pi)
             self.play_directional_sound(sound_effects['buzz'], angle)
-            self.next_buzz = self.sound_timer + random.uniform(*BUZZ_INTERVAL)
+            self.next_buzz = self.sound_timer + rng.uniform(*BUZZ_INTERVAL)
 
     def play_directional_sound(self, sound, world_angle):
         angle_diff = world_angle - self.yaw_s
@@ -430,17 +507,15 @@ class BackroomsEngine:
             channel.set_volume(avg_volume * left_volume, avg_volume * right_volume)
 
     def update_player_footsteps(self, dt, footstep_sound, crouch_footstep_sound):
-        if self.is_moving:
-            current_phase = self.head_bob_time % 1.0
-            if ((self.last_footstep_phase > 0.5 and current_phase < 0.5) or
-                    (self.last_footstep_phase > current_phase and current_phase < 0.1)):
+        # One step per head bob cycle, as head_bob_time passes each whole number
+        step_idx = int(self.head_bob_time)
+        if step_idx != self._last_step_idx:
+            self._last_step_idx = step_idx
+            if self.is_moving:
                 if self.is_crouching:
                     crouch_footstep_sound.play()
                 else:
                     footstep_sound.play()
-            self.last_footstep_phase = current_phase
-        else:
-            self.last_footstep_phase = 0
 
     def update_flicker(self, dt):
         if self.is_flickering:
@@ -449,7 +524,7 @@ class BackroomsEngine:
                 self.is_flickering = False
                 self.flicker_brightness = 1.0
         else:
-            if random.random() < FLICKER_CHANCE:
+            if self._py_rng.random() < FLICKER_CHANCE:
                 self.is_flickering = True
                 self.flicker_timer = 0
                 self.flicker_brightness = 1.0 - FLICKER_BRIGHTNESS
@@ -475,6 +550,27 @@ class BackroomsEngine:
             for i in range(3)
         )
 
+    def _shade_colors(self, colors, tint, noise, distances, ao=None):
+        """
+        apply_zone_tint, apply_surface_noise, ambient occlusion and apply_fog
+        for (P, 3) colors at once. Same truncation steps as the scalar
+        versions, so the resulting RGB values are identical.
+        """
+        c = np.floor(np.minimum(255, colors * tint))
+        c = np.clip(c + noise[:, None], 0, 255)
+        if ao is not None:
+            c = np.floor(c * ao[:, None])
+
+        brightness = self.flicker_brightness
+        c = np.floor(c * brightness)
+        if FOG_ENABLED:
+            fog = np.floor(np.multiply(FOG_COLOR, brightness))
+            d = distances[:, None]
+            amount = (d - FOG_START) / (FOG_END - FOG_START)
+            mixed = np.floor(c * (1 - amount) + fog * amount)
+            c = np.where(d < FOG_START, c, np.where(d > FOG_END, fog, mixed))
+        return c.astype(int)
+
     def apply_surface_noise(self, color, x, z):
         noise = ((int(x) * 13 + int(z) * 17) % 5) - 2
         return tuple(max(0, min(255, c + noise)) for c in color)
@@ -491,83 +587,115 @@ class BackroomsEngine:
         if not math.isfinite(x) or not math.isfinite(z):
             return True
 
-        player_radius = 15.0
-        half_thick = WALL_THICKNESS / 2
-        check_range = 600
-
-        for px in range(int(x - check_range), int(x + check_range) + PILLAR_SPACING, PILLAR_SPACING):
-            px_grid = (px // PILLAR_SPACING) * PILLAR_SPACING
-            for pz in range(int(z - check_range), int(z + check_range) + PILLAR_SPACING, PILLAR_SPACING):
-                pz_grid = (pz // PILLAR_SPACING) * PILLAR_SPACING
-
-                # Check horizontal wall
-                if self._has_wall_between(px_grid, pz_grid, px_grid + PILLAR_SPACING, pz_grid):
-                    wall_key = tuple(sorted([(px_grid, pz_grid), (px_grid + PILLAR_SPACING, pz_grid)]))
-                    if wall_key in self.destroyed_walls:
-                        continue
-
-                    opening_type = self._has_doorway_in_wall(px_grid, pz_grid, px_grid + PILLAR_SPACING, pz_grid)
-                    wall_z = pz_grid
-                    wall_x_start = px_grid
-                    wall_x_end = px_grid + PILLAR_SPACING
-
-                    if opening_type == "hallway":
-                        opening_width = HALLWAY_WIDTH
-                    elif opening_type == "doorway":
-                        opening_width = 60
-                    else:
-                        opening_width = 0
-
-                    if opening_width > 0:
-                        opening_start = wall_x_start + (PILLAR_SPACING - opening_width) / 2
-                        opening_end = opening_start + opening_width
-
-                        if abs(z - wall_z) < (half_thick + player_radius):
-                            if (wall_x_start <= x <= opening_start - player_radius) or \
-                                    (opening_end + player_radius <= x <= wall_x_end):
-                                return True
-                    else:
-                        if (wall_x_start - player_radius <= x <= wall_x_end + player_radius and
-                                abs(z - wall_z) < (half_thick + player_radius)):
-                            return True
-
-                # Check vertical wall
-                if self._has_wall_between(px_grid, pz_grid, px_grid, pz_grid + PILLAR_SPACING):
-                    wall_key = tuple(sorted([(px_grid, pz_grid), (px_grid, pz_grid + PILLAR_SPACING)]))
-                    if wall_key in self.destroyed_walls:
-                        continue
-
-                    opening_type = self._has_doorway_in_wall(px_grid, pz_grid, px_grid, pz_grid + PILLAR_SPACING)
-                    wall_x = px_grid
-                    wall_z_start = pz_grid
-                    wall_z_end = pz_grid + PILLAR_SPACING
-
-                    if opening_type == "hallway":
-                        opening_width = HALLWAY_WIDTH
-                    elif opening_type == "doorway":
-                        opening_width = 60
-                    else:
-                        opening_width = 0
-
-                    if opening_width > 0:
-                        opening_start = wall_z_start + (PILLAR_SPACING - opening_width) / 2
-                        opening_end = opening_start + opening_width
-
-                        if abs(x - wall_x) < (half_thick + player_radius):
-                            if (wall_z_start <= z <= opening_start - player_radius) or \
-                                    (opening_end + player_radius <= z <= wall_z_end):
-                                return True
-                    else:
-                        if (wall_z_start - player_radius <= z <= wall_z_end + player_radius and
-                                abs(x - wall_x) < (half_thick + player_radius)):
-                            return True
-
+        return self._blocked(x, z, *self._walls_near(x, x, z, z))
+
+    def _collide_axes(self, x0, z0, dx, dz):
+        """
+        Free-space test for a move and its two single-axis slides:
+        (x0+dx, z0+dz), (x0+dx, z0) and (x0, z0+dz). Equivalent to three
+        check_collision() calls, but gathers the nearby walls only once.
+        """
+        x1, z1 = x0 + dx, z0 + dz
+        points = ((x1, z1), (x1, z0), (x0, z1))
+        if not all(math.isfinite(v) for v in (x0, z0, x1, z1)):
+            return tuple(not self.check_collision(px, pz) for px, pz in points)
+
+        walls = self._walls_near(min(x0, x1), max(x0, x1), min(z0, z1), max(z0, z1))
+        return tuple(not self._blocked(px, pz, *walls) for px, pz in points)
+
+    def _walls_near(self, min_x, max_x, min_z, max_z):
+        """
+        Intact walls the player could touch anywhere in the given box, as
+        (wall_z, spans) for horizontal and (wall_x, spans) for vertical walls.
+        Only grid lines within reach of the box and the corners along them
+        that can span it are visited.
+        """
+        s = PILLAR_SPACING
+        reach = WALL_THICKNESS / 2 + PLAYER_RADIUS
+        corners_x = range((math.floor(min_x / s) - 1) * s, (math.floor(max_x / s) + 1) * s + 1, s)
+        corners_z = range((math.floor(min_z / s) - 1) * s, (math.floor(max_z / s) + 1) * s + 1, s)
+
+        h_walls = []
+        for wall_z in range(math.ceil((min_z - reach) / s) * s, math.floor((max_z + reach) / s) * s + 1, s):
+            for px in corners_x:
+                h_spans = self._wall_spans(px, wall_z)[0]
+                if h_spans:
+                    h_walls.append((wall_z, h_spans))
+
+        v_walls = []
+        for wall_x in range(math.ceil((min_x - reach) / s) * s, math.floor((max_x + reach) / s) * s + 1, s):
+            for pz in corners_z:
+                v_spans = self._wall_spans(wall_x, pz)[1]
+                if v_spans:
+                    v_walls.append((wall_x, v_spans))
+
+        return h_walls, v_walls
+
+    @staticmethod
+    def _blocked(x, z, h_walls, v_walls):
+        """Whether (x, z) collides with any of the walls from _walls_near()."""
+        reach = WALL_THICKNESS / 2 + PLAYER_RADIUS
+        for wall_z, spans in h_walls:
+            if abs(z - wall_z) < reach:
+                for lo, hi in spans:
+                    if lo <= x <= hi:
+                        return True
+        for wall_x, spans in v_walls:
+            if abs(x - wall_x) < reach:
+                for lo, hi in spans:
+                    if lo <= z <= hi:
+                        return True
         return False
 
+    def _wall_spans(self, px, pz):
+        """
+        (h_spans, v_spans) for the walls leaving grid corner (px, pz): the
+        (lo, hi) ranges along each wall where the player collides, i.e. the
+        whole wall widened by the player radius, or the two solid pieces on
+        either side of a doorway/hallway. None where there is no intact wall.
+
+        Destruction is baked in, so destroy_wall() evicts the corner. A
+        destroyed horizontal wall also clears the vertical wall at the same
+        corner, as collision always has.
+        """
+        cell = self._span_index.get((px, pz))
+        if cell is None:
+            h_key, v_key, h_opening, v_opening = self._cell_walls(px, pz)[:4]
+            if h_key in self.destroyed_walls:
+                h_key = v_key = None
+            elif v_key in self.destroyed_walls:
+                v_key = None
+
+            spans = []
+            for key, start, opening_type in ((h_key, px, h_opening), (v_key, pz, v_opening)):
+                end = start + PILLAR_SPACING
+                if key is None:
+                    spans.append(None)
+                    continue
+
+                if opening_type == "hallway":
+                    opening_width = HALLWAY_WIDTH
+                elif opening_type == "doorway":
+                    opening_width = 60
+                else:
+                    opening_width = 0
+
+                if opening_width > 0:
+                    opening_start = start + (PILLAR_SPACING - opening_width) / 2
+                    opening_end = opening_start + opening_width
+                    spans.append(((start, opening_start - PLAYER_RADIUS),
+                                  (opening_end + PLAYER_RADIUS, end)))
+                else:
+                    spans.append(((start - PLAYER_RADIUS, end + PLAYER_RADIUS),))
+            cell = (spans[0], spans[1])
+            self._span_index[(px, pz)] = cell
+        return cell
+
     # === PLAYER UPDATE ===
 
     def update(self, dt, keys, mouse_rel):
         """Main update loop for player movement and physics."""
+        self._refresh_scaled_heights()
         self.play_time += dt
 
         # Mouse look
@@ -643,13 +771,14 @@ class BackroomsEngine:
             self.is_moving = True
 
         if move_x != 0 or move_z != 0:
-            if not self.check_collision(self.x + move_x, self.z + move_z):
+            free_xz, free_x, free_z = self._collide_axes(self.x, self.z, move_x, move_z)
+            if free_xz:
                 new_x = self.x + move_x
                 new_z = self.z + move_z
             else:
-                if not self.check_collision(self.x + move_x, self.z):
+                if free_x:
                     new_x = self.x + move_x
-                if not self.check_collision(self.x, self.z + move_z):
+                if free_z:
                     new_z = self.z + move_z
 
         self.x = new_x
@@ -681,8 +810,8 @@ class BackroomsEngine:
         bob_y = 0
         bob_x = 0
         if self.is_moving:
-            bob_y = math.sin(self.head_bob_time * 2 * math.pi) * get_scaled_head_bob_amount()
-            bob_x = math.sin(self.head_bob_time * math.pi) * get_scaled_head_bob_sway()
+            bob_y = math.sin(self.head_bob_time * 2 * math.pi) * self._bob_amount
+            bob_x = math.sin(self.head_bob_time * math.pi) * self._bob_sway
 
         # Camera shake
         self.camera_shake_time += dt
@@ -703,33 +832,16 @@ class BackroomsEngine:
         self.yaw_s += (self.yaw - self.yaw_s) * rotation_smooth
 
         # Update debris
-        floor_y = get_scaled_floor_y()
-        MAX_DEBRIS = 12000
-        DEBRIS_CULL_DIST = 900.0
-
-        px, pz = self.x_s, self.z_s
-        for d in self.debris_pieces:
-            d.update(dt, floor_y)
-            if not d.active:
-                continue
-
-            dx = d.cx - px
-            dz = d.cz - pz
-            if (dx * dx + dz * dz) > (DEBRIS_CULL_DIST * DEBRIS_CULL_DIST):
-                d.active = False
-
-        self.debris_pieces = [d for d in self.debris_pieces if d.active]
-
-        if len(self.debris_pieces) > MAX_DEBRIS:
-            self.debris_pieces = self.debris_pieces[-MAX_DEBRIS:]
+        self.debris.update(dt, self._floor_y, cull_center=(self.x_s, self.z_s),
+                           cull_dist=DEBRIS_CULL_DIST)
 
     # === CAMERA TRANSFORMS ===
 
     def world_to_camera(self, x, y, z):
-        """Transform world coordinates to camera space."""
-        x -= self.x_s
-        y -= self.y_s
-        z -= self.z_s
+        """Transform world coordinates to camera space; works on arrays too."""
+        x = x - self.x_s
+        y = y - self.y_s
+        z = z - self.z_s
 
         cy = math.cos(self.yaw_s)
         sy = math.sin(self.yaw_s)
@@ -748,16 +860,54 @@ class BackroomsEngine:
         x, y, z = p
         if z <= NEAR:
             return None
-        aspect = self.height / self.width
-        FOV_ANGLE = 90  # degrees
-        focal_length = (self.width * 0.5) / math.tan(math.radians(FOV_ANGLE * 0.5))
-        scale = focal_length / z
+        scale = self._focal / z
         sx = self.width * 0.5 + x * scale
-        sy = self.height * 0.5 - y * scale * aspect
+        sy = self.height * 0.5 - y * scale * self._aspect
         if not (math.isfinite(sx) and math.isfinite(sy)):
             return None
         return (sx, sy)
 
+    def _project_batch(self, x, y, z):
+        """project_camera()'s screen point for camera-space arrays, without the near test."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = self._focal / z
+            return (self.width * 0.5 + x * scale,
+                    self.height * 0.5 - y * scale * self._aspect)
+
+    def _clip_near_batch(self, x, y, z, focal_length, aspect):
+        """
+        clip_poly_near() followed by project_camera() for (M, V) camera-space
+        polygons at once. Returns one list of screen points per polygon, or
+        None where the clipped polygon is degenerate or can't be projected.
+        """
+        prev_x, prev_y, prev_z = (np.roll(a, 1, axis=1) for a in (x, y, z))
+        cur_in = z >= NEAR
+        dz = z - prev_z
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (NEAR - prev_z) / dz
+            crossing = (((prev_z >= NEAR) != cur_in) & (np.abs(dz) >= 0.00001) &
+                        (t >= -0.001) & (t <= 1.001))
+            t = np.clip(t, 0.0, 1.0)
+
+            # Each vertex emits the crossing on the edge leading into it, then
+            # itself if it's in front: up to 2V output slots per polygon
+            m = len(z)
+            out_x = np.stack((prev_x + (x - prev_x) * t, x), axis=2).reshape(m, -1)
+            out_y = np.stack((prev_y + (y - prev_y) * t, y), axis=2).reshape(m, -1)
+            out_z = np.stack((np.full_like(z, NEAR + 0.001), z), axis=2).reshape(m, -1)
+            keep = np.stack((crossing, cur_in), axis=2).reshape(m, -1)
+
+            scale = focal_length / out_z
+            screen_x = self.width * 0.5 + out_x * scale
+            screen_y = self.height * 0.5 - out_y * scale * aspect
+        ok = (out_z > NEAR) & np.isfinite(out_z) & np.isfinite(screen_x) & np.isfinite(screen_y)
+        valid = ((ok | ~keep).all(axis=1) & (keep.sum(axis=1) >= 3)).tolist()
+
+        polys = []
+        for poly_ok, xs, ys, ks in zip(valid, screen_x.tolist(), screen_y.tolist(), keep.tolist()):
+            polys.append([(sx, sy) for sx, sy, k in zip(xs, ys, ks) if k] if poly_ok else None)
+        return polys
+
     def clip_poly_near(self, poly):
         """Clip polygon against near plane."""
         if not poly or len(poly) < 3:
@@ -816,77 +966,152 @@ class BackroomsEngine:
 
     def draw_world_poly(self, surface, world_pts, color, width_edges=0, edge_color=None,
                         is_wall=False, is_floor=False, is_ceiling=False):
-        """Draw a 3D polygon with all effects applied."""
-        cam_pts = [self.world_to_camera(*p) for p in world_pts]
-
-        behind_count = sum(1 for p in cam_pts if p[2] < NEAR)
-        if behind_count == len(cam_pts):
+        """Queue a 3D polygon; render() transforms and draws the queue in one batch."""
+        self._poly_queue.append((world_pts, color, width_edges, edge_color, is_wall))
+
+    def draw_world_polys(self, surface, polys, color, width_edges=0, edge_color=None, is_wall=False):
+        """Queue several 3D polygons sharing one style, in order."""
+        self._poly_queue.extend((world_pts, color, width_edges, edge_color, is_wall)
+                                for world_pts in polys)
+
+    def _flush_world_polys(self, surface):
+        """Draw every queued polygon, in queue order, with all effects applied.
+
+        All vertices go through world_to_camera() and _project_batch() as one
+        NumPy batch (same operation order as project_camera(), so results are
+        identical); only polygons straddling the near plane get clipped.
+        """
+        queue = self._poly_queue
+        self._poly_queue = []
+        if not queue:
             return
 
-        distances = [math.sqrt(p[0] ** 2 + p[1] ** 2 + p[2] ** 2) for p in cam_pts]
-        avg_dist = sum(distances) / len(distances) if distances else 0
-
-        if avg_dist > RENDER_DISTANCE * 1.5:
-            return
-
-        avg_x = sum(p[0] for p in world_pts) / len(world_pts)
-        avg_z = sum(p[2] for p in world_pts) / len(world_pts)
-        avg_y = sum(p[1] for p in world_pts) / len(world_pts)
-
-        zone = self.get_zone_at(avg_x, avg_z)
-        tinted_color = self.apply_zone_tint(color, *zone)
-        noisy_color = self.apply_surface_noise(tinted_color, avg_x, avg_z)
+        # (P, V, 3) world vertices; the world is built from quads only
+        world = np.array([item[0] for item in queue], dtype=float)
+        x1, y2, z2 = self.world_to_camera(world[..., 0], world[..., 1], world[..., 2])
+        screen_x, screen_y = self._project_batch(x1, y2, z2)
+        projectable = ((z2 > NEAR) & np.isfinite(screen_x) & np.isfinite(screen_y)).all(axis=1)
+        with np.errstate(invalid='ignore'):
+            projectable &= self._poly_visible(screen_x.min(axis=1), screen_x.max(axis=1),
+                                              screen_y.min(axis=1), screen_y.max(axis=1))
+
+        distances = np.sqrt(x1 ** 2 + y2 ** 2 + z2 ** 2).sum(axis=1) / world.shape[1]
+        centroids = world.sum(axis=1) / world.shape[1]
+
+        # Zone tint, surface noise, ambient occlusion and fog for every poly
+        zones, zone_of = np.unique(np.floor_divide(centroids[:, ::2], ZONE_SIZE),
+                                   axis=0, return_inverse=True)
+        tints = np.array([self.get_zone_properties(zx, zz)['color_tint']
+                          for zx, zz in zones.astype(int).tolist()], dtype=float)
+        tint = tints[zone_of.reshape(-1)]
+
+        cell = np.trunc(centroids[:, ::2]).astype(np.int64)
+        noise = (cell[:, 0] * 13 + cell[:, 1] * 17) % 5 - 2
+
+        ao = np.ones(len(queue))
+        is_wall = np.array([item[4] for item in queue], dtype=bool)
+        avg_y = centroids[:, 1]
+        floor_y = self._floor_y
+        wall_h = self._wall_h
+        ao[is_wall & (avg_y > wall_h - 20)] = 0.8
+        ao[is_wall & (avg_y < floor_y + 20)] = 0.7
+
+        fill_colors = self._shade_colors(np.array([item[1] for item in queue], dtype=float),
+                                         tint, noise, distances, ao).tolist()
+        if any(item[2] > 0 and item[3] is not None for item in queue):
+            edge_colors = self._shade_colors(
+                np.array([item[1] if item[3] is None else item[3] for item in queue], dtype=float),
+                tint, noise, distances).tolist()
+
+        in_front = z2 >= NEAR
+        any_front = in_front.any(axis=1)
+        all_front = in_front.all(axis=1)
+
+        # Polygons straddling the near plane get clipped and projected as a batch
+        straddling = np.flatnonzero(any_front & ~all_front)
+        clipped = dict(zip(straddling.tolist(),
+                           self._clip_near_batch(x1[straddling], y2[straddling], z2[straddling],
+                                                 self._focal, self._aspect)))
+
+        any_front = any_front.tolist()
+        all_front = all_front.tolist()
+        projectable = projectable.tolist()
+        screen_x = screen_x.tolist()
+        screen_y = screen_y.tolist()
+        distances = distances.tolist()
+
+        for i, (world_pts, color, width_edges, edge_color, is_wall) in enumerate(queue):
+            if not any_front[i]:
+                continue
 
-        # Ambient occlusion
-        ao_factor = 1.0
-        if is_wall:
-            if avg_y < get_scaled_floor_y() + 20:
-                ao_factor = 0.7
-            elif avg_y > get_scaled_wall_height() - 20:
-                ao_factor = 0.8
+            if distances[i] > RENDER_DISTANCE * 1.5:
+                continue
 
-        ao_color = tuple(int(c * ao_factor) for c in noisy_color)
-        fogged_color = self.apply_fog(ao_color, avg_dist)
+            if all_front[i]:
+                # Nothing to clip: use the batched projection and screen cull
+                if not projectable[i]:
+                    continue
+                screen_pts = list(zip(screen_x[i], screen_y[i]))
+            else:
+                screen_pts = clipped[i]
+                if screen_pts is None:
+                    continue
 
-        cam_pts = self.clip_poly_near(cam_pts)
-        if len(cam_pts) < 3:
-            return
+                xs = [p[0] for p in screen_pts]
+                ys = [p[1] for p in screen_pts]
+                if not self._poly_visible(min(xs), max(xs), min(ys), max(ys)):
+                    continue
 
-        screen_pts = [self.project_camera(p) for p in cam_pts]
-        if any(p is None for p in screen_pts):
-            return
+            try:
+                pygame.draw.polygon(surface, fill_colors[i], screen_pts)
+            except:
+                continue
 
-        min_x = min(p[0] for p in screen_pts)
-        max_x = max(p[0] for p in screen_pts)
-        min_y = min(p[1] for p in screen_pts)
-        max_y = max(p[1] for p in screen_pts)
+            if width_edges > 0 and edge_color is not None:
+                fogged_edge = edge_colors[i]
+                try:
+                    pygame.draw.lines(surface, fogged_edge, True, screen_pts, width_edges)
+                except:
+                    pass
 
+    def _project_debris(self, max_dist):
+        """
+        (sx, sy, size, color) arrays for every live debris piece within
+        max_dist (on the floor plane) that lands on screen, far to near, with
+        sx/sy truncated to whole pixels. All pieces go through
+        world_to_camera() and _project_batch() as one NumPy batch, with the
+        same operations as project_camera(), so results match the scalar path.
+        """
+        live = self.debris.live()
+        pos = self.debris.pos[live].astype(float)
+        dx = pos[:, 0] - self.x_s
+        dz = pos[:, 2] - self.z_s
+        dist_sq = dx * dx + dz * dz
+
+        x1, y2, z2 = self.world_to_camera(pos[:, 0], pos[:, 1], pos[:, 2])
+        screen_x, screen_y = self._project_batch(x1, y2, z2)
+        with np.errstate(invalid='ignore'):
+            shown = ((dist_sq <= max_dist * max_dist) & (z2 > NEAR) &
+                     (screen_x >= 0) & (screen_x < self.width) &
+                     (screen_y >= 0) & (screen_y < self.height))
+
+        # Far to near; a stable sort keeps spawn order among equal depths
+        order = np.flatnonzero(shown)
+        order = order[np.argsort(-z2[order], kind='stable')]
+        sizes = np.maximum(1, (3 * (1.0 - np.sqrt(dist_sq[order]) / max_dist)).astype(int))
+        return (screen_x[order].astype(int), screen_y[order].astype(int), sizes,
+                self.debris.color[live[order]])
+
+    def _poly_visible(self, min_x, max_x, min_y, max_y):
+        """Screen-space bounds near enough the view and not sub-pixel; works on arrays too."""
         margin = 500
-        if (max_x < -margin or min_x > self.width + margin or
-                max_y < -margin or min_y > self.height + margin):
-            return
-
-        if (max_x - min_x) < 0.5 and (max_y - min_y) < 0.5:
-            return
-
-        try:
-            pygame.draw.polygon(surface, fogged_color, screen_pts)
-        except:
-            return
-
-        if width_edges > 0 and edge_color is not None:
-            tinted_edge = self.apply_zone_tint(edge_color, *zone)
-            noisy_edge = self.apply_surface_noise(tinted_edge, avg_x, avg_z)
-            fogged_edge = self.apply_fog(noisy_edge, avg_dist)
-            try:
-                for i in range(len(screen_pts)):
-                    pygame.draw.line(surface, fogged_edge, screen_pts[i],
-                                     screen_pts[(i + 1) % len(screen_pts)], width_edges)
-            except:
-                pass
+        return ((max_x >= -margin) & (min_x <= self.width + margin) &
+                (max_y >= -margin) & (min_y <= self.height + margin) &
+                ((max_x - min_x >= 0.5) | (max_y - min_y >= 0.5)))
 
     def render(self, surface):
         """Main render method."""
+        self._refresh_scaled_heights()
         target_surface = self.render_surface
         target_surface.fill(BLACK)
 
@@ -894,65 +1119,51 @@ class BackroomsEngine:
         self.width = target_surface.get_width()
         self.height = target_surface.get_height()
 
-        render_queue = []
-        render_queue.extend(self._get_floor_tiles())
-        render_queue.extend(self._get_ceiling_tiles())
-        render_queue.extend(self._get_pillars())
-        render_queue.extend(self._get_walls())
-
-        render_queue.sort(key=lambda item: item[0], reverse=True)
-
-        for depth, draw_func in render_queue:
-            draw_func(target_surface)
+        queues = (self._get_floor_tiles(), self._get_ceiling_tiles(),
+                  self._get_pillars(), self._get_walls())
+        depth_sq, kinds, xs, zs = (np.concatenate(column) for column in zip(*queues))
+
+        # Back to front; squared distance sorts the same, and a stable sort
+        # keeps queue order among equal depths
+        order = np.argsort(-depth_sq, kind='stable')
+        for kind, x, z in zip(kinds[order].tolist(), xs[order].tolist(), zs[order].tolist()):
+            if kind == _FLOOR:
+                self._draw_floor_tile(target_surface, x, z)
+            elif kind == _CEILING:
+                self._draw_ceiling_tile(target_surface, x, z)
+            elif kind == _PILLAR:
+                self._draw_single_pillar(target_surface, x, z)
+            elif kind == _WALL_H:
+                self._draw_connecting_wall(target_surface, x, z, x + PILLAR_SPACING, z)
+            else:
+                self._draw_connecting_wall(target_surface, x, z, x, z + PILLAR_SPACING)
+        self._flush_world_polys(target_surface)
 
-        # Draw debris
+        # Draw debris: single pixels go straight into the surface in one
+        # scatter (later, nearer pieces win), then the larger, close pieces
         DEBRIS_RENDER_DIST = 600.0
-        px, pz = self.x_s, self.z_s
-
-        debris_to_render = []
-        for d in self.debris_pieces:
-            if not d.active:
-                continue
-
-            dx = d.cx - px
-            dz = d.cz - pz
-            dist_sq = dx * dx + dz * dz
-            if dist_sq > DEBRIS_RENDER_DIST * DEBRIS_RENDER_DIST:
-                continue
-
-            cam_pos = self.world_to_camera(d.cx, d.cy, d.cz)
-            if cam_pos[2] <= NEAR:
-                continue
-
-            screen_pos = self.project_camera(cam_pos)
-            if screen_pos is None:
-                continue
-
-            sx, sy = screen_pos
-            if 0 <= sx < self.width and 0 <= sy < self.height:
-                dist = math.sqrt(dist_sq)
-                size = max(1, int(3 * (1.0 - dist / DEBRIS_RENDER_DIST)))
-                debris_to_render.append((cam_pos[2], sx, sy, size, d.color))
-
-        debris_to_render.sort(key=lambda x: x[0], reverse=True)
-        for _, sx, sy, size, color in debris_to_render:
-            if size == 1:
-                try:
-                    target_surface.set_at((int(sx), int(sy)), color)
-                except:
-                    pass
-            else:
-                pygame.draw.circle(target_surface, color, (int(sx), int(sy)), size)
+        sx, sy, sizes, colors = self._project_debris(DEBRIS_RENDER_DIST)
+        single = sizes == 1
+        if single.any():
+            pixels = pygame.surfarray.pixels3d(target_surface)
+            pixels[sx[single], sy[single]] = colors[single]
+            del pixels
+        big = ~single
+        for x, y, size, color in zip(sx[big].tolist(), sy[big].tolist(), sizes[big].tolist(),
+                                     map(tuple, colors[big].tolist())):
+            pygame.draw.circle(target_surface, color, (x, y), size)
 
         self.width, self.height = original_width, original_height
 
         if self.render_scale < 1.0:
             final_surface = pygame.Surface((self.width, self.height))
-            pygame.transform.smoothscale(target_surface, (self.width, self.height), final_surface)
+            upscale = pygame.transform.smoothscale if self.smooth_upscale else pygame.transform.scale
+            upscale(target_surface, (self.width, self.height), final_surface)
         else:
-            final_surface = target_surface.copy()
+            final_surface = target_surface
 
-        surface.blit(final_surface, (0, 0))
+        if final_surface is not surface:
+            surface.blit(final_surface, (0, 0))
 
         # Crosshair
         cx, cy = self.width // 2, self.height // 2
@@ -960,62 +1171,50 @@ class BackroomsEngine:
 
     # === RUBBLE SPAWNING ===
 
-    def _spawn_rubble_pile(self, x1, z1, x2, z2):
+    def _spawn_rubble_pile(self, wall_key):
         """Spawn a persistent rubble pile for pre-destroyed walls."""
-        wall_key = tuple(sorted([(x1, z1), (x2, z2)]))
-
         # Only spawn once
         if wall_key in self._spawned_rubble:
             return
 
         self._spawned_rubble.add(wall_key)
+        (x1, z1), (x2, z2) = self._decode_key(wall_key)
 
-        floor_y = get_scaled_floor_y()
-        half_thick = WALL_THICKNESS / 2
+        floor_y = self._floor_y
 
         # Determine bounds
         if x1 == x2:
-            min_x, max_x = x1 - half_thick, x1 + half_thick
+            min_x, max_x = x1 - _HALF_THICK, x1 + _HALF_THICK
             min_z, max_z = min(z1, z2), max(z1, z2)
         else:
             min_x, max_x = min(x1, x2), max(x1, x2)
-            min_z, max_z = z1 - half_thick, z1 + half_thick
+            min_z, max_z = z1 - _HALF_THICK, z1 + _HALF_THICK
 
         # Spawn settled debris
-        for _ in range(80):
-            px = random.uniform(min_x, max_x)
-            pz = random.uniform(min_z, max_z)
-
-            color_var = random.randint(-40, 20)
-            particle_color = (
-                max(0, min(255, 200 + color_var)),
-                max(0, min(255, 180 + color_var)),
-                max(0, min(255, 160 + color_var))
-            )
-
-            # Settled debris (no velocity)
-            self.debris_pieces.append(Debris(
-                (px, floor_y, pz),
-                particle_color,
-                velocity=None  # Settled from the start
-            ))
+        count = 80
+        rng = self._rng
+        positions = np.empty((count, 3))
+        positions[:, 0] = rng.uniform(min_x, max_x, count)
+        positions[:, 1] = floor_y
+        positions[:, 2] = rng.uniform(min_z, max_z, count)
 
-    # === WORLD GENERATION ===
+        color_var = rng.integers(-40, 21, (count, 1))
+        colors = np.clip(np.add((200, 180, 160), color_var), 0, 255)
 
-    """
-    Replace your existing _get_pillar_at() method in engine.py with this:
-    """
+        # Settled debris (no velocity)
+        self.debris.spawn(positions, colors)
+
+    # === WORLD GENERATION ===
 
     def _get_pillar_at(self, px, pz):
         """Check if there's a pillar at this position based on PILLAR_MODE."""
+        if PILLAR_MODE == "none":
+            return False
+
         key = (px, pz)
         if key in self.pillar_cache:
             return self.pillar_cache[key]
 
-        if PILLAR_MODE == "none":
-            self.pillar_cache[key] = False
-            return False
-
         offset = PILLAR_SPACING // 2
         is_on_pillar_grid = (px % PILLAR_SPACING == offset) and (pz % PILLAR_SPACING == offset)
 
@@ -1027,9 +1226,7 @@ class BackroomsEngine:
             self.pillar_cache[key] = True
             return True
 
-        import random as rnd
         seed = hash((px, pz, self.world_seed)) % 100000
-        rnd.seed(seed)
 
         probability_map = {
             "sparse": 0.10,
@@ -1038,37 +1235,34 @@ class BackroomsEngine:
         }
 
         probability = probability_map.get(PILLAR_MODE, 0.0)
-        has_pillar = rnd.random() < probability
+        has_pillar = _hash01(seed) < probability
 
         self.pillar_cache[key] = has_pillar
         return has_pillar
 
     def _has_wall_between(self, x1, z1, x2, z2):
         """Check if there's a wall between two points."""
-        key = tuple(sorted([(x1, z1), (x2, z2)]))
-
-        if key in self.wall_cache:
-            return self.wall_cache[key]
-
         is_horizontal = (z1 == z2)
         is_vertical = (x1 == x2)
 
         if not (is_horizontal or is_vertical):
-            self.wall_cache[key] = False
             return False
 
+        key = self._wall_key(x1, z1, x2, z2)
+        if key in self.wall_cache:
+            return self.wall_cache[key]
+
         # Check if this wall should spawn pre-damaged
         if key not in self.pre_damaged_walls:
             zone = self.get_zone_at((x1 + x2) / 2, (z1 + z2) / 2)
             props = self.get_zone_properties(*zone)
 
             # Deterministic decay check
-            decay_seed = int(x1 * 7919 + z1 * 6577 + x2 * 4993 + z2 * 3571 + self.world_seed * 9973)
-            random.seed(decay_seed)
+            decay_hash = _mix64(int(x1 * 7919 + z1 * 6577 + x2 * 4993 + z2 * 3571 + self.world_seed * 9973))
 
-            if random.random() < props['decay_chance']:
+            if decay_hash / 2 ** 64 < props['decay_chance']:
                 # Randomly damaged (0.0 = rubble, 0.3 = heavily damaged, 0.7 = cracked, 1.0 = intact)
-                self.pre_damaged_walls[key] = random.uniform(0.0, 0.5)
+                self.pre_damaged_walls[key] = 0.5 * _hash01(decay_hash + 1)
 
                 # If completely destroyed, add to destroyed_walls
                 if self.pre_damaged_walls[key] < 0.2:
@@ -1087,8 +1281,7 @@ class BackroomsEngine:
         else:
             door_seed = int(x1 * 3571 + ((z1 + z2) // 2) * 2897 + self.world_seed * 9973)
 
-        random.seed(door_seed)
-        roll = random.random()
+        roll = _hash01(door_seed)
 
         if roll < 0.3:
             return "hallway"
@@ -1097,152 +1290,169 @@ class BackroomsEngine:
         else:
             return None
 
-    def _get_floor_tiles(self):
-        """Generate floor tile render queue."""
-        render_items = []
+    @staticmethod
+    def _wall_key(x1, z1, x2, z2):
+        """Canonical int key for the axis-aligned wall between two grid corners."""
+        horizontal = z1 == z2
+        gx = min(x1, x2) // PILLAR_SPACING + _KEY_BIAS
+        gz = min(z1, z2) // PILLAR_SPACING + _KEY_BIAS
+        return (gx << (2 * _KEY_AXIS_BITS + 1)) | (gz << (_KEY_AXIS_BITS + 1)) | horizontal
+
+    @staticmethod
+    def _decode_key(key):
+        """Wall key back to its ((x1, z1), (x2, z2)) end points, min corner first."""
+        x = ((key >> (2 * _KEY_AXIS_BITS + 1)) - _KEY_BIAS) * PILLAR_SPACING
+        z = (((key >> (_KEY_AXIS_BITS + 1)) & _KEY_MASK) - _KEY_BIAS) * PILLAR_SPACING
+        if key & 1:
+            return (x, z), (x + PILLAR_SPACING, z)
+        return (x, z), (x, z + PILLAR_SPACING)
+
+    def _cell_walls(self, px, pz):
+        """Walls leaving grid corner (px, pz) toward +x and +z, built on first use.
+
+        Returns (h_key, v_key, h_opening, v_opening, h_damage, v_damage):
+        the wall keys (None where there is no wall), their
+        _has_doorway_in_wall() types and their pre_damaged_walls states
+        (1.0 when intact). Destruction is not baked in; check
+        destroyed_walls separately.
+        """
+        cell = self._wall_index.get((px, pz))
+        if cell is None:
+            h_key = v_key = h_opening = v_opening = None
+            h_damage = v_damage = 1.0
+            if self._has_wall_between(px, pz, px + PILLAR_SPACING, pz):
+                h_key = self._wall_key(px, pz, px + PILLAR_SPACING, pz)
+                h_opening = self._has_doorway_in_wall(px, pz, px + PILLAR_SPACING, pz)
+                h_damage = self.pre_damaged_walls.get(h_key, 1.0)
+            if self._has_wall_between(px, pz, px, pz + PILLAR_SPACING):
+                v_key = self._wall_key(px, pz, px, pz + PILLAR_SPACING)
+                v_opening = self._has_doorway_in_wall(px, pz, px, pz + PILLAR_SPACING)
+                v_damage = self.pre_damaged_walls.get(v_key, 1.0)
+            cell = (h_key, v_key, h_opening, v_opening, h_damage, v_damage)
+            self._wall_index[(px, pz)] = cell
+        return cell
+
+    def _render_bounds(self):
+        """Grid-aligned (start_x, end_x, start_z, end_z) of the render square around the camera."""
         render_range = RENDER_DISTANCE
-        tile_size = PILLAR_SPACING
-
-        start_x = int((self.x_s - render_range) // tile_size) * tile_size
-        end_x = int((self.x_s + render_range) // tile_size) * tile_size
-        start_z = int((self.z_s - render_range) // tile_size) * tile_size
-        end_z = int((self.z_s + render_range) // tile_size) * tile_size
-
-        floor_y = get_scaled_floor_y()
-
-        for px in range(start_x, end_x, tile_size):
-            for pz in range(start_z, end_z, tile_size):
-                tile_center_x = px + tile_size / 2
-                tile_center_z = pz + tile_size / 2
-
-                dist = math.sqrt((tile_center_x - self.x_s) ** 2 +
-                                 (tile_center_z - self.z_s) ** 2)
-
-                if dist > render_range + tile_size:
-                    continue
-
-                def make_draw_func(px=px, pz=pz, floor_y=floor_y, tile_size=tile_size):
-                    return lambda surface: self.draw_world_poly(
-                        surface,
-                        [(px, floor_y, pz), (px + tile_size, floor_y, pz),
-                         (px + tile_size, floor_y, pz + tile_size),
-                         (px, floor_y, pz + tile_size)],
-                        self.carpet_avg,
-                        width_edges=0,
-                        edge_color=None,
-                        is_floor=True
-                    )
-
-                render_items.append((dist, make_draw_func()))
+        return (int((self.x_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING,
+                int((self.x_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING,
+                int((self.z_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING,
+                int((self.z_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING)
+
+    def _visible_cells(self, kind):
+        """
+        Candidates the render queue generators sweep, as int arrays in
+        grid-scan order: 'tile' -> (px, pz) tile corners, 'pillar' ->
+        (pillar_x, pillar_z) of intact pillars, 'wall' -> (kind, px, pz) of
+        intact walls. Rebuilt only when the render square moves onto a new
+        grid row or column, or when something is destroyed.
+        """
+        bounds = (self._render_bounds(), self._destruction_gen)
+        cached = self._visible_cells_cache.get(kind)
+        if cached is not None and cached[0] == bounds:
+            return cached[1]
+
+        start_x, end_x, start_z, end_z = bounds[0]
+        S = PILLAR_SPACING
+        if kind == 'tile':
+            cells = [(px, pz) for px in range(start_x, end_x, S) for pz in range(start_z, end_z, S)]
+        elif kind == 'pillar' and PILLAR_MODE == "none":
+            cells = []
+        elif kind == 'pillar':
+            offset = S // 2
+            cells = [(px + offset, pz + offset)
+                     for px in range(start_x, end_x + S, S)
+                     for pz in range(start_z, end_z + S, S)
+                     if (px + offset, pz + offset) not in self.destroyed_pillars
+                     and self._get_pillar_at(px + offset, pz + offset)]
+        else:
+            cells = []
+            for px in range(start_x, end_x + S, S):
+                for pz in range(start_z, end_z + S, S):
+                    h_key, v_key = self._cell_walls(px, pz)[:2]
+                    if h_key is not None and h_key not in self.destroyed_walls:
+                        cells.append((_WALL_H, px, pz))
+                    if v_key is not None and v_key not in self.destroyed_walls:
+                        cells.append((_WALL_V, px, pz))
+
+        width = 3 if kind == 'wall' else 2
+        cells = tuple(np.array(cells, dtype=np.int64).reshape(-1, width).T)
+        self._visible_cells_cache[kind] = (bounds, cells)
+        return cells
 
-        return render_items
+    def _get_floor_tiles(self):
+        """Floor tile render queue as (dist_sq, kind, px, pz) arrays."""
+        return self._get_tiles(_FLOOR)
 
     def _get_ceiling_tiles(self):
-        """Generate ceiling tile render queue."""
-        render_items = []
+        """Ceiling tile render queue as (dist_sq, kind, px, pz) arrays."""
+        return self._get_tiles(_CEILING)
+
+    def _get_tiles(self, kind):
+        """Tiles within render range, tagged with kind, as queue arrays."""
         render_range = RENDER_DISTANCE
         tile_size = PILLAR_SPACING
 
-        start_x = int((self.x_s - render_range) // tile_size) * tile_size
-        end_x = int((self.x_s + render_range) // tile_size) * tile_size
-        start_z = int((self.z_s - render_range) // tile_size) * tile_size
-        end_z = int((self.z_s + render_range) // tile_size) * tile_size
-
-        ceiling_y = get_scaled_wall_height()
-
-        for px in range(start_x, end_x, tile_size):
-            for pz in range(start_z, end_z, tile_size):
-                tile_center_x = px + tile_size / 2
-                tile_center_z = pz + tile_size / 2
-
-                dist = math.sqrt((tile_center_x - self.x_s) ** 2 +
-                                 (tile_center_z - self.z_s) ** 2)
-
-                if dist > render_range + tile_size:
-                    continue
-
-                def make_draw_func(px=px, pz=pz, ceiling_y=ceiling_y, tile_size=tile_size):
-                    return lambda surface: self.draw_world_poly(
-                        surface,
-                        [(px, ceiling_y, pz), (px + tile_size, ceiling_y, pz),
-                         (px + tile_size, ceiling_y, pz + tile_size),
-                         (px, ceiling_y, pz + tile_size)],
-                        self.ceiling_avg,
-                        width_edges=0,
-                        edge_color=None,
-                        is_ceiling=True
-                    )
-
-                render_items.append((dist, make_draw_func()))
-
-        return render_items
+        px, pz = self._visible_cells('tile')
+        dx = px + tile_size / 2 - self.x_s
+        dz = pz + tile_size / 2 - self.z_s
+        dist_sq = dx ** 2 + dz ** 2
+        keep = (dist_sq <= (render_range + tile_size) ** 2) & self._in_view(dx, dz)
+        return dist_sq[keep], np.full(np.count_nonzero(keep), kind), px[keep], pz[keep]
 
     def _get_pillars(self):
-        """Generate pillar render queue."""
-        render_items = []
-        render_range = RENDER_DISTANCE
-
-        offset = PILLAR_SPACING // 2
-
-        start_x = int((self.x_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        end_x = int((self.x_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        start_z = int((self.z_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        end_z = int((self.z_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING
-
-        for px in range(start_x, end_x + PILLAR_SPACING, PILLAR_SPACING):
-            for pz in range(start_z, end_z + PILLAR_SPACING, PILLAR_SPACING):
-                pillar_x = px + offset
-                pillar_z = pz + offset
-
-                pillar_key = (pillar_x, pillar_z)
-
-                if pillar_key in self.destroyed_pillars:
-                    continue
-
-                if self._get_pillar_at(pillar_x, pillar_z):
-                    dist = math.sqrt((pillar_x - self.x_s) ** 2 + (pillar_z - self.z_s) ** 2)
-                    if dist < RENDER_DISTANCE:
-                        def make_draw_func(pillar_x=pillar_x, pillar_z=pillar_z):
-                            return lambda surface: self._draw_single_pillar(surface, pillar_x, pillar_z)
-
-                        render_items.append((dist, make_draw_func()))
-
-        return render_items
-
-    def _draw_single_pillar(self, surface, px, pz):
-        """Draw a single pillar."""
-        s = PILLAR_SIZE
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
-        edge_color = (220, 200, 70)
-
+        """Pillar render queue as (dist_sq, kind, pillar_x, pillar_z) arrays."""
+        pillar_x, pillar_z = self._visible_cells('pillar')
+        dx = pillar_x - self.x_s
+        dz = pillar_z - self.z_s
+        dist_sq = dx ** 2 + dz ** 2
+        keep = (dist_sq < RENDER_DISTANCE ** 2) & self._in_view(dx, dz)
+        return dist_sq[keep], np.full(np.count_nonzero(keep), _PILLAR), pillar_x[keep], pillar_z[keep]
+
+    def _draw_floor_tile(self, surface, px, pz):
+        """Draw one floor tile."""
+        tile_size = PILLAR_SPACING
+        floor_y = self._floor_y
         self.draw_world_poly(
             surface,
-            [(px, h, pz), (px + s, h, pz), (px + s, floor_y, pz), (px, floor_y, pz)],
-            self.pillar_avg,
-            width_edges=1,
-            edge_color=edge_color
+            [(px, floor_y, pz), (px + tile_size, floor_y, pz),
+             (px + tile_size, floor_y, pz + tile_size),
+             (px, floor_y, pz + tile_size)],
+            self.carpet_avg,
+            width_edges=0,
+            edge_color=None,
+            is_floor=True
         )
 
+    def _draw_ceiling_tile(self, surface, px, pz):
+        """Draw one ceiling tile."""
+        tile_size = PILLAR_SPACING
+        ceiling_y = self._wall_h
         self.draw_world_poly(
             surface,
-            [(px + s, h, pz + s), (px, h, pz + s), (px, floor_y, pz + s), (px + s, floor_y, pz + s)],
-            self.pillar_avg,
-            width_edges=1,
-            edge_color=edge_color
+            [(px, ceiling_y, pz), (px + tile_size, ceiling_y, pz),
+             (px + tile_size, ceiling_y, pz + tile_size),
+             (px, ceiling_y, pz + tile_size)],
+            self.ceiling_avg,
+            width_edges=0,
+            edge_color=None,
+            is_ceiling=True
         )
 
-        self.draw_world_poly(
-            surface,
-            [(px, h, pz), (px, h, pz + s), (px, floor_y, pz + s), (px, floor_y, pz)],
-            self.pillar_avg,
-            width_edges=1,
-            edge_color=edge_color
-        )
+    def _draw_single_pillar(self, surface, px, pz):
+        """Draw a single pillar."""
+        s = PILLAR_SIZE
+        h = self._wall_h
+        floor_y = self._floor_y
+        edge_color = (220, 200, 70)
 
-        self.draw_world_poly(
+        self.draw_world_polys(
             surface,
-            [(px + s, h, pz + s), (px + s, h, pz), (px + s, floor_y, pz), (px + s, floor_y, pz + s)],
+            [[(px, h, pz), (px + s, h, pz), (px + s, floor_y, pz), (px, floor_y, pz)],
+             [(px + s, h, pz + s), (px, h, pz + s), (px, floor_y, pz + s), (px + s, floor_y, pz + s)],
+             [(px, h, pz), (px, h, pz + s), (px, floor_y, pz + s), (px, floor_y, pz)],
+             [(px + s, h, pz + s), (px + s, h, pz), (px + s, floor_y, pz), (px + s, floor_y, pz + s)]],
             self.pillar_avg,
             width_edges=1,
             edge_color=edge_color
@@ -1251,154 +1461,91 @@ class BackroomsEngine:
     def _draw_thick_wall_segment(self, surface, x1, z1, x2, z2, h, floor_y,
                                  edge_color, baseboard_color, baseboard_height):
         """Draw a thick wall segment with baseboard."""
-        half_thick = WALL_THICKNESS / 2
         wall_side_color = (230, 210, 70)
 
+        # (x, z) of the segment's ends on its front (-x / -z) and back faces
         if x1 == x2:  # Vertical wall
-            x = x1
-
-            # Front face (main wall)
-            self.draw_world_poly(
-                surface,
-                [(x - half_thick, h, z1), (x - half_thick, h, z2),
-                 (x - half_thick, floor_y + baseboard_height, z2), (x - half_thick, floor_y + baseboard_height, z1)],
-                self.wall_avg, width_edges=1, edge_color=edge_color, is_wall=True
-            )
-            # Front baseboard
-            self.draw_world_poly(
-                surface,
-                [(x - half_thick, floor_y + baseboard_height, z1), (x - half_thick, floor_y + baseboard_height, z2),
-                 (x - half_thick, floor_y, z2), (x - half_thick, floor_y, z1)],
-                baseboard_color, width_edges=0, is_wall=True
-            )
-
-            # Back face (main wall)
-            self.draw_world_poly(
-                surface,
-                [(x + half_thick, h, z2), (x + half_thick, h, z1),
-                 (x + half_thick, floor_y + baseboard_height, z1), (x + half_thick, floor_y + baseboard_height, z2)],
-                self.wall_avg, width_edges=1, edge_color=edge_color, is_wall=True
-            )
-            # Back baseboard
-            self.draw_world_poly(
-                surface,
-                [(x + half_thick, floor_y + baseboard_height, z2), (x + half_thick, floor_y + baseboard_height, z1),
-                 (x + half_thick, floor_y, z1), (x + half_thick, floor_y, z2)],
-                baseboard_color, width_edges=0, is_wall=True
-            )
-
-            # End caps
-            self.draw_world_poly(
-                surface,
-                [(x - half_thick, h, z1), (x + half_thick, h, z1),
-                 (x + half_thick, floor_y, z1), (x - half_thick, floor_y, z1)],
-                wall_side_color, width_edges=1, edge_color=edge_color, is_wall=True
-            )
-            self.draw_world_poly(
-                surface,
-                [(x + half_thick, h, z2), (x - half_thick, h, z2),
-                 (x - half_thick, floor_y, z2), (x + half_thick, floor_y, z2)],
-                wall_side_color, width_edges=1, edge_color=edge_color, is_wall=True
-            )
+            xf, xb = x1 - _HALF_THICK, x1 + _HALF_THICK
+            f1, f2, b1, b2 = (xf, z1), (xf, z2), (xb, z1), (xb, z2)
         else:  # Horizontal wall
-            z = z1
-
-            # Front face (main wall)
-            self.draw_world_poly(
-                surface,
-                [(x1, h, z - half_thick), (x2, h, z - half_thick),
-                 (x2, floor_y + baseboard_height, z - half_thick), (x1, floor_y + baseboard_height, z - half_thick)],
-                self.wall_avg, width_edges=1, edge_color=edge_color, is_wall=True
-            )
-            # Front baseboard
-            self.draw_world_poly(
-                surface,
-                [(x1, floor_y + baseboard_height, z - half_thick), (x2, floor_y + baseboard_height, z - half_thick),
-                 (x2, floor_y, z - half_thick), (x1, floor_y, z - half_thick)],
-                baseboard_color, width_edges=0, is_wall=True
-            )
-
-            # Back face (main wall)
-            self.draw_world_poly(
-                surface,
-                [(x2, h, z + half_thick), (x1, h, z + half_thick),
-                 (x1, floor_y + baseboard_height, z + half_thick), (x2, floor_y + baseboard_height, z + half_thick)],
-                self.wall_avg, width_edges=1, edge_color=edge_color, is_wall=True
-            )
-            # Back baseboard
-            self.draw_world_poly(
-                surface,
-                [(x2, floor_y + baseboard_height, z + half_thick), (x1, floor_y + baseboard_height, z + half_thick),
-                 (x1, floor_y, z + half_thick), (x2, floor_y, z + half_thick)],
-                baseboard_color, width_edges=0, is_wall=True
-            )
-
-            # End caps
-            self.draw_world_poly(
-                surface,
-                [(x1, h, z + half_thick), (x1, h, z - half_thick),
-                 (x1, floor_y, z - half_thick), (x1, floor_y, z + half_thick)],
-                wall_side_color, width_edges=1, edge_color=edge_color, is_wall=True
-            )
-            self.draw_world_poly(
-                surface,
-                [(x2, h, z - half_thick), (x2, h, z + half_thick),
-                 (x2, floor_y, z + half_thick), (x2, floor_y, z - half_thick)],
-                wall_side_color, width_edges=1, edge_color=edge_color, is_wall=True
-            )
+            zf, zb = z1 - _HALF_THICK, z1 + _HALF_THICK
+            f1, f2, b1, b2 = (x1, zf), (x2, zf), (x1, zb), (x2, zb)
+
+        # Each corner at ceiling, baseboard top and floor height, built once
+        # and shared by every face that touches it
+        base_y = floor_y + baseboard_height
+        f1t, f1m, f1b = [(f1[0], y, f1[1]) for y in (h, base_y, floor_y)]
+        f2t, f2m, f2b = [(f2[0], y, f2[1]) for y in (h, base_y, floor_y)]
+        b1t, b1m, b1b = [(b1[0], y, b1[1]) for y in (h, base_y, floor_y)]
+        b2t, b2m, b2b = [(b2[0], y, b2[1]) for y in (h, base_y, floor_y)]
+
+        # Front face and baseboard, back face and baseboard
+        self.draw_world_poly(surface, [f1t, f2t, f2m, f1m], self.wall_avg,
+                             width_edges=1, edge_color=edge_color, is_wall=True)
+        self.draw_world_poly(surface, [f1m, f2m, f2b, f1b], baseboard_color,
+                             width_edges=0, is_wall=True)
+        self.draw_world_poly(surface, [b2t, b1t, b1m, b2m], self.wall_avg,
+                             width_edges=1, edge_color=edge_color, is_wall=True)
+        self.draw_world_poly(surface, [b2m, b1m, b1b, b2b], baseboard_color,
+                             width_edges=0, is_wall=True)
+
+        # End caps
+        if x1 == x2:
+            caps = [[f1t, b1t, b1b, f1b], [b2t, f2t, f2b, b2b]]
+        else:
+            caps = [[b1t, f1t, f1b, b1b], [f2t, b2t, b2b, f2b]]
+        self.draw_world_polys(surface, caps, wall_side_color,
+                              width_edges=1, edge_color=edge_color, is_wall=True)
 
     def _get_walls(self):
-        """Generate wall render queue."""
-        render_items = []
-        render_range = RENDER_DISTANCE
-
-        start_x = int((self.x_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        end_x = int((self.x_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        start_z = int((self.z_s - render_range) // PILLAR_SPACING) * PILLAR_SPACING
-        end_z = int((self.z_s + render_range) // PILLAR_SPACING) * PILLAR_SPACING
-
-        for px in range(start_x, end_x + PILLAR_SPACING, PILLAR_SPACING):
-            for pz in range(start_z, end_z + PILLAR_SPACING, PILLAR_SPACING):
-                # Horizontal walls
-                wall_key_h = tuple(sorted([(px, pz), (px + PILLAR_SPACING, pz)]))
-                if self._has_wall_between(px, pz, px + PILLAR_SPACING, pz) and wall_key_h not in self.destroyed_walls:
-                    wall_center_x = px + PILLAR_SPACING / 2
-                    wall_center_z = pz
-                    dist = math.sqrt((wall_center_x - self.x_s) ** 2 + (wall_center_z - self.z_s) ** 2)
-
-                    def make_draw_func(px=px, pz=pz):
-                        return lambda surface: self._draw_connecting_wall(surface, px, pz, px + PILLAR_SPACING, pz)
-
-                    render_items.append((dist, make_draw_func()))
-
-                # Vertical walls
-                wall_key_v = tuple(sorted([(px, pz), (px, pz + PILLAR_SPACING)]))
-                if self._has_wall_between(px, pz, px, pz + PILLAR_SPACING) and wall_key_v not in self.destroyed_walls:
-                    wall_center_x = px
-                    wall_center_z = pz + PILLAR_SPACING / 2
-                    dist = math.sqrt((wall_center_x - self.x_s) ** 2 + (wall_center_z - self.z_s) ** 2)
-
-                    def make_draw_func(px=px, pz=pz):
-                        return lambda surface: self._draw_connecting_wall(surface, px, pz, px, pz + PILLAR_SPACING)
-
-                    render_items.append((dist, make_draw_func()))
+        """Wall render queue as (dist_sq, kind, px, pz) arrays, measured from wall midpoints."""
+        kinds, px, pz = self._visible_cells('wall')
+        # Horizontal walls run along x from their corner, vertical ones along z
+        half = PILLAR_SPACING / 2
+        along_x = np.where(kinds == _WALL_H, half, 0.0)
+        dx = px + along_x - self.x_s
+        dz = pz + (half - along_x) - self.z_s
+        dist_sq = dx ** 2 + dz ** 2
+        keep = self._in_view(dx, dz)
+        return dist_sq[keep], kinds[keep], px[keep], pz[keep]
+
+    def _in_view(self, dx, dz):
+        """
+        Conservative yaw-cone cull for grid items whose reference point is
+        (dx, dz) from the camera; anything of the item lies within one grid
+        spacing of that point. False only where no part of the item can be
+        on screen at any pitch: nothing behind the camera is visible beyond
+        the camera's height above the floor or below the ceiling (times the
+        tangent of half the field of view), and the sides of the view widen
+        by that same tangent.
+        """
+        cy = math.cos(self.yaw_s)
+        sy = math.sin(self.yaw_s)
+        forward = dx * sy + dz * cy
+        side = dx * cy - dz * sy
 
-        return render_items
+        reach = PILLAR_SPACING
+        tan_half = self.width * 0.5 / self._focal
+        vertical = max(abs(self._wall_h - self.y_s), abs(self._floor_y - self.y_s))
+        return ((forward >= -(vertical * tan_half + reach)) &
+                (np.abs(side) <= tan_half * (np.maximum(forward, 0.0) + reach + vertical) + reach))
 
     def _draw_connecting_wall(self, surface, x1, z1, x2, z2):
-        """Draw a connecting wall with doorways/hallways and damage."""
-        wall_key = tuple(sorted([(x1, z1), (x2, z2)]))
-
-        # Check for pre-existing damage
-        damage_state = self.pre_damaged_walls.get(wall_key, 1.0)
+        """Draw the wall from grid corner (x1, z1), with doorways/hallways and damage."""
+        # Key, opening and pre-existing damage all come from the corner's index entry
+        h_key, v_key, h_opening, v_opening, h_damage, v_damage = self._cell_walls(x1, z1)
+        if z1 == z2:
+            wall_key, opening_type, damage_state = h_key, h_opening, h_damage
+        else:
+            wall_key, opening_type, damage_state = v_key, v_opening, v_damage
 
         if damage_state < 0.2:
             # Wall is rubble - spawn debris piles if not already done
-            self._spawn_rubble_pile(x1, z1, x2, z2)
+            self._spawn_rubble_pile(wall_key)
             return  # Don't draw wall
 
-        h = get_scaled_wall_height()
-        floor_y = get_scaled_floor_y()
+        h = self._wall_h
+        floor_y = self._floor_y
 
         # Modify colors based on damage
         if damage_state < 0.5:
@@ -1416,8 +1563,6 @@ class BackroomsEngine:
 
         baseboard_height = 8
 
-        opening_type = self._has_doorway_in_wall(x1, z1, x2, z2)
-
         if opening_type is None:
             self._draw_thick_wall_segment(surface, x1, z1, x2, z2, h, floor_y,
                                           edge_color, baseboard_color, baseboard_height)
@@ -1477,7 +1622,7 @@ class BackroomsEngine:
             self.world_seed = world.get('seed', self.world_seed)
 
             destroyed_walls_list = world.get('destroyed_walls', [])
-            self.destroyed_walls = {tuple(tuple(point) for point in wall) for wall in destroyed_walls_list}
+            self.destroyed_walls = {self._wall_key(*wall[0], *wall[1]) for wall in destroyed_walls_list}
 
             stats = save_data.get('stats', {})
             self.play_time = stats.get('play_time', 0)
@@ -1485,6 +1630,10 @@ class BackroomsEngine:
             self.pillar_cache.clear()
             self.wall_cache.clear()
             self.zone_cache.clear()
+            self._wall_index.clear()
+            self._span_index.clear()
+            self._visible_cells_cache.clear()
+            self._target_cache = None
 
             print(f"Loaded world with seed: {self.world_seed}")
             print(f"Loaded {len(self.destroyed_walls)} destroyed walls")
@@ -11,16 +11,19 @@ Now includes:
 import pygame
 import sys
 from enum import Enum, auto
+from functools import lru_cache
 
 from config import *
 from engine import BackroomsEngine
 from audio import (
+    LazySound,
     generate_backrooms_hum,
     generate_footstep_sound,
     generate_player_footstep_sound,
     generate_crouch_footstep_sound,
     generate_electrical_buzz,
-    generate_destroy_sound
+    generate_destroy_sound,
+    prefetch_sounds
 )
 from save_system import SaveSystem
 
@@ -35,20 +38,47 @@ def set_mouse_locked(engine, locked: bool):
         engine.toggle_mouse()
 
 
+# Window events after which the whole display must be presented again
+_REPAINT_EVENTS = (
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+    pygame.WINDOWFOCUSGAINED,
+)
+
+_dim_overlays = {}
+
+
 def _draw_dim_overlay(screen, alpha=180):
     """Draw a translucent black overlay over the whole screen."""
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, max(0, min(255, alpha))))
+    alpha = max(0, min(255, alpha))
+    overlay = _dim_overlays.get(alpha)
+    if overlay is None:
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        _dim_overlays[alpha] = overlay
     screen.blit(overlay, (0, 0))
 
 
-def _draw_centered_text(screen, font, text, y, color=(220, 220, 220)):
+@lru_cache(maxsize=64)
+def _centered_text(font, text, y, color):
+    """Rendered text and its horizontally centered position, built once per line."""
     surf = font.render(text, True, color)
-    x = WIDTH // 2 - surf.get_width() // 2
-    screen.blit(surf, (x, y))
+    return surf, (WIDTH // 2 - surf.get_width() // 2, y)
+
+
+def _draw_centered_text(screen, font, text, y, color=(220, 220, 220)):
+    surf, pos = _centered_text(font, text, y, color)
+    screen.blit(surf, pos)
     return surf
 
 
+def _prerender_centered(lines):
+    """Render (font, text, y, color) lines once into (surface, pos) pairs centered on screen."""
+    return [_centered_text(font, text, y, color) for font, text, y, color in lines]
+
+
 def _start_hum(hum_sound):
     """Start ambient hum if not already playing."""
     if hum_sound:
@@ -68,10 +98,31 @@ def main():
     pygame.mixer.pre_init(SAMPLE_RATE, -16, 2, AUDIO_BUFFER_SIZE)
     pygame.mixer.init()
 
+    # Sounds are synthesized in the background while the display, fonts and
+    # engine are set up (hum first, it's needed on entering the world)
+    hum_sound = LazySound(generate_backrooms_hum)
+    footstep_sound = LazySound(generate_footstep_sound)
+    player_footstep_sound = LazySound(generate_player_footstep_sound)
+    crouch_footstep_sound = LazySound(generate_crouch_footstep_sound)
+    buzz_sound = LazySound(generate_electrical_buzz)
+    destroy_sound = LazySound(generate_destroy_sound)
+
+    prefetch_sounds([hum_sound, destroy_sound, player_footstep_sound,
+                     crouch_footstep_sound, footstep_sound, buzz_sound])
+
     # Create display
     SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN if FULLSCREEN else 0)
     pygame.display.set_caption("The Backrooms - Destructible")
 
+    # Only let the events we actually handle into the queue; joystick axes
+    # and text-input events never reach the Python loop. KEYUP is kept so
+    # the cached keyboard state knows when to refresh, and the repaint
+    # events so MENU/PAUSED re-present after the window was covered.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                              pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                              *_REPAINT_EVENTS])
+
     clock = pygame.time.Clock()
     font = pygame.font.SysFont("consolas", 14)
     small_font = pygame.font.SysFont("consolas", 12)
@@ -84,15 +135,6 @@ def main():
     pygame.mouse.set_visible(True)
     pygame.event.set_grab(False)
 
-    # Generate sounds
-    print("Generating ambient sounds...")
-    hum_sound = generate_backrooms_hum()
-    footstep_sound = generate_footstep_sound()
-    player_footstep_sound = generate_player_footstep_sound()
-    crouch_footstep_sound = generate_crouch_footstep_sound()
-    buzz_sound = generate_electrical_buzz()
-    destroy_sound = generate_destroy_sound()
-
     sound_effects = {
         'footstep': footstep_sound,
         'player_footstep': player_footstep_sound,
@@ -101,6 +143,41 @@ def main():
         'destroy': destroy_sound
     }
 
+    # -------------------------
+    # Static UI text (rendered once)
+    # -------------------------
+    menu_text = _prerender_centered([
+        (title_font, "THE BACKROOMS", HEIGHT // 2 - 120, (250, 240, 150)),
+        (font, "Destructible • Procedural • Infinite", HEIGHT // 2 - 80, (200, 220, 250)),
+        (font, "Press ENTER to enter", HEIGHT // 2 - 10, (220, 220, 220)),
+        (font, "Press ESC to quit", HEIGHT // 2 + 20, (180, 180, 180)),
+        (small_font, "Tip: F9 loads Slot 1 from the menu", HEIGHT // 2 + 60, (160, 160, 160)),
+    ])
+    pause_text = _prerender_centered([
+        (title_font, "PAUSED", HEIGHT // 2 - 90, (250, 240, 150)),
+        (font, "ENTER / ESC: Resume", HEIGHT // 2 - 20, (220, 220, 220)),
+        (font, "BACKSPACE: Return to Menu", HEIGHT // 2 + 10, (200, 200, 200)),
+        (font, "Q: Quit", HEIGHT // 2 + 40, (180, 180, 180)),
+    ])
+
+    help_texts = [
+        "=== CONTROLS ===",
+        "WASD: Move | M: Mouse Look | JL: Turn",
+        "SHIFT: Run | C: Crouch | SPACE: Jump",
+        "LEFT CLICK or E: Destroy Wall (aim at wall)",
+        "R: Toggle Performance | H: Help | ESC: Pause",
+        "=== SAVE/LOAD ===",
+        "F5: Quick Save (Slot 1) | F9: Quick Load (Slot 1)",
+        "=== DESTRUCTION ===",
+        "Aim center crosshair at wall and click to destroy",
+        "Watch debris pile form on the floor!",
+    ]
+    help_y = HEIGHT - 280
+    help_text = [
+        (font.render(text, True, (250, 240, 150)), (10, help_y + i * 25))
+        for i, text in enumerate(help_texts)
+    ]
+
     # -------------------------
     # UI state
     # -------------------------
@@ -108,6 +185,8 @@ def main():
     help_timer = 5.0
     save_message = ""
     save_message_timer = 0.0
+    fps_surface = None
+    fps_timer = 0.0
 
     # -------------------------
     # Game state
@@ -121,10 +200,135 @@ def main():
     # Don't start hum until you actually "enter" the world
     hum_playing = False
 
-    # Main loop
+    # Frozen world frame shown behind MENU/PAUSED; rendered once on entry
+    backdrop = None
+    # Backdrop + dim overlay + static text for one of MENU/PAUSED, composed
+    # once per state entry. After it is flipped only the menu's save/load
+    # message is redrawn and presented, and only when it changes.
+    screen_cache = None
+    screen_cache_state = None
+    repaint = True
+    shown_message = None
+    message_rect = None
+
+    # -------------------------
+    # Key handlers (one table per state)
+    # -------------------------
     running = True
+
+    def quit_game():
+        nonlocal running
+        running = False
+
+    def enter_world():
+        nonlocal state, backdrop, show_help, help_timer, save_message, save_message_timer, hum_playing
+        state = GameState.PLAYING
+        backdrop = None
+        set_mouse_locked(engine, True)
+        show_help = True
+        help_timer = 5.0
+        save_message = ""
+        save_message_timer = 0.0
+
+        # Start hum now
+        if not hum_playing:
+            _start_hum(hum_sound)
+            hum_playing = True
+
+    def menu_quick_load():
+        # Optional: quick load straight from menu
+        nonlocal backdrop, save_message, save_message_timer
+        save_data = SaveSystem.load_game(slot=1)
+        if save_data:
+            engine.load_from_save(save_data)
+            backdrop = None
+            save_message = "Loaded slot 1."
+        else:
+            save_message = "No save found in slot 1."
+        save_message_timer = 2.0
+
+    def pause():
+        nonlocal state
+        # If mouse look is on, pause should also release mouse so menu feels normal
+        if engine.mouse_look:
+            engine.toggle_mouse()
+        set_mouse_locked(engine, False)
+        state = GameState.PAUSED
+
+    def toggle_help():
+        nonlocal show_help, help_timer
+        show_help = not show_help
+        if show_help:
+            help_timer = 999
+
+    def quick_save():
+        nonlocal save_message, save_message_timer
+        SaveSystem.save_game(engine, slot=1)
+        save_message = "Game saved to slot 1!"
+        save_message_timer = 3.0
+
+    def quick_load():
+        nonlocal save_message, save_message_timer
+        save_data = SaveSystem.load_game(slot=1)
+        if save_data:
+            engine.load_from_save(save_data)
+            save_message = "Game loaded from slot 1!"
+        else:
+            save_message = "No save found in slot 1!"
+        save_message_timer = 3.0
+
+    def destroy_target():
+        target = engine.find_targeted_wall_or_pillar()
+        if target:
+            target_type, target_key = target
+            if target_type == 'wall':
+                engine.destroy_wall(target_key, sound_effects['destroy'])
+            elif target_type == 'pillar':
+                engine.destroy_pillar(target_key, sound_effects['destroy'])
+
+    def resume():
+        nonlocal state, backdrop
+        state = GameState.PLAYING
+        backdrop = None
+        set_mouse_locked(engine, True)
+
+    def return_to_menu():
+        nonlocal state
+        state = GameState.MENU
+        if not engine.mouse_look:
+            engine.toggle_mouse()
+
+    keymaps = {
+        GameState.MENU: {
+            pygame.K_ESCAPE: quit_game,
+            pygame.K_RETURN: enter_world,
+            pygame.K_KP_ENTER: enter_world,
+            pygame.K_F9: menu_quick_load,
+        },
+        GameState.PLAYING: {
+            pygame.K_ESCAPE: pause,
+            pygame.K_r: engine.toggle_render_scale,
+            pygame.K_h: toggle_help,
+            pygame.K_F5: quick_save,
+            pygame.K_F9: quick_load,
+            pygame.K_e: destroy_target,
+        },
+        GameState.PAUSED: {
+            pygame.K_ESCAPE: resume,
+            pygame.K_RETURN: resume,
+            pygame.K_KP_ENTER: resume,
+            pygame.K_BACKSPACE: return_to_menu,
+            pygame.K_q: quit_game,
+        },
+    }
+
+    # Keyboard state, re-read only after a key went down or up
+    keys = None
+    keys_dirty = True
+
+    # Main loop
     while running:
-        dt = clock.tick(FPS) / 1000
+        dt = clock.tick(FPS if state == GameState.PLAYING else MENU_FPS) / 1000
         mouse_rel = None
 
         # Timers only matter while playing (or keep them global; either is fine)
@@ -142,165 +346,92 @@ def main():
         # -------------------------
         # Event handling
         # -------------------------
-        for event in pygame.event.get():
+        # Pump once, then drain the whole queue without re-pumping
+        pygame.event.pump()
+        for event in pygame.event.get(pump=False):
             if event.type == pygame.QUIT:
                 running = False
 
             # MOUSE motion only matters in PLAYING
-            if event.type == pygame.MOUSEMOTION and state == GameState.PLAYING and engine.mouse_look:
-                mouse_rel = event.rel
-
-            if event.type == pygame.KEYDOWN:
-
-                # Global quit (ESC in menu, or explicit quit in pause)
-                if state == GameState.MENU:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-
-                    # Enter world
-                    if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                        state = GameState.PLAYING
-                        set_mouse_locked(engine, True)
-                        show_help = True
-                        help_timer = 5.0
-                        save_message = ""
-                        save_message_timer = 0.0
-
-                        # Start hum now
-                        if not hum_playing:
-                            _start_hum(hum_sound)
-                            hum_playing = True
-
-                    # Optional: quick load straight from menu
-                    if event.key == pygame.K_F9:
-                        save_data = SaveSystem.load_game(slot=1)
-                        if save_data:
-                            engine.load_from_save(save_data)
-                            save_message = "Loaded slot 1."
-                            save_message_timer = 2.0
-                        else:
-                            save_message = "No save found in slot 1."
-                            save_message_timer = 2.0
-
-                elif state == GameState.PLAYING:
-                    # Pause toggle
-                    if event.key == pygame.K_ESCAPE:
-                        # If mouse look is on, pause should also release mouse so menu feels normal
-                        if engine.mouse_look:
-                            engine.toggle_mouse()
-                        set_mouse_locked(engine, False)
-                        state = GameState.PAUSED
-
-                        continue
-
-
-
-                    # Render scale
-                    if event.key == pygame.K_r:
-                        engine.toggle_render_scale()
-
-                    # Help toggle
-                    if event.key == pygame.K_h:
-                        show_help = not show_help
-                        if show_help:
-                            help_timer = 999
-
-                    # Quick save
-                    if event.key == pygame.K_F5:
-                        SaveSystem.save_game(engine, slot=1)
-                        save_message = "Game saved to slot 1!"
-                        save_message_timer = 3.0
-
-                    # Quick load
-                    if event.key == pygame.K_F9:
-                        save_data = SaveSystem.load_game(slot=1)
-                        if save_data:
-                            engine.load_from_save(save_data)
-                            save_message = "Game loaded from slot 1!"
-                            save_message_timer = 3.0
-                        else:
-                            save_message = "No save found in slot 1!"
-                            save_message_timer = 3.0
-
-                    # Destroy wall (E key)
-                    if event.key == pygame.K_e:
-                        target = engine.find_targeted_wall_or_pillar()
-                        if target:
-                            target_type, target_key = target
-                            if target_type == 'wall':
-                                engine.destroy_wall(target_key, sound_effects['destroy'])
-                            elif target_type == 'pillar':
-                                engine.destroy_pillar(target_key, sound_effects['destroy'])
-
-                elif state == GameState.PAUSED:
-                    # Resume
-                    if event.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_KP_ENTER):
-                        state = GameState.PLAYING
-                        set_mouse_locked(engine, True)
-                        # If you want mouse locked on resume, toggle it back on (optional)
-                        # Only do this if you prefer "game feel" by default:
-                        # if not engine.mouse_look: engine.toggle_mouse()
-                        continue
-
-                    # Return to menu
-                    if event.key == pygame.K_BACKSPACE:
-                        state = GameState.MENU
-                        if not engine.mouse_look:
-                            engine.toggle_mouse()
-                        continue
-
-                    # Quit from pause
-                    if event.key == pygame.K_q:
-                        running = False
+            elif event.type == pygame.MOUSEMOTION:
+                # Sum every motion event this frame so no movement is dropped
+                if state == GameState.PLAYING and engine.mouse_look:
+                    dx, dy = event.rel
+                    if mouse_rel:
+                        mouse_rel = (mouse_rel[0] + dx, mouse_rel[1] + dy)
+                    else:
+                        mouse_rel = (dx, dy)
+
+            elif event.type == pygame.KEYUP:
+                keys_dirty = True
+
+            elif event.type in _REPAINT_EVENTS:
+                repaint = True
+
+            elif event.type == pygame.KEYDOWN:
+                keys_dirty = True
+                handler = keymaps[state].get(event.key)
+                if handler:
+                    handler()
 
             # Mouse click destruction only in PLAYING
-            # Mouse click
-            if event.type == pygame.MOUSEBUTTONDOWN and state == GameState.PLAYING:
-                if event.button == 1:
-                    target = engine.find_targeted_wall_or_pillar()
-                    if target:
-                        target_type, target_key = target
-                        if target_type == 'wall':
-                            engine.destroy_wall(target_key, sound_effects['destroy'])
-                        elif target_type == 'pillar':
-                            engine.destroy_pillar(target_key, sound_effects['destroy'])
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if state == GameState.PLAYING and event.button == 1:
+                    destroy_target()
 
         # -------------------------
         # Update + Render
         # -------------------------
-        if state == GameState.MENU:
-            # Render a simple “background” (reuse engine render so it still feels like a place)
-            engine.render(SCREEN)
-            _draw_dim_overlay(SCREEN, alpha=190)
-
-            _draw_centered_text(SCREEN, title_font, "THE BACKROOMS", HEIGHT // 2 - 120, (250, 240, 150))
-            _draw_centered_text(SCREEN, font, "Destructible • Procedural • Infinite", HEIGHT // 2 - 80, (200, 220, 250))
-
-            _draw_centered_text(SCREEN, font, "Press ENTER to enter", HEIGHT // 2 - 10, (220, 220, 220))
-            _draw_centered_text(SCREEN, font, "Press ESC to quit", HEIGHT // 2 + 20, (180, 180, 180))
-            _draw_centered_text(SCREEN, small_font, "Tip: F9 loads Slot 1 from the menu", HEIGHT // 2 + 60, (160, 160, 160))
-
-            if save_message and save_message_timer > 0:
-                _draw_centered_text(SCREEN, font, save_message, HEIGHT // 2 + 95, (100, 255, 100))
-
-            pygame.display.flip()
-            continue
-
-        if state == GameState.PAUSED:
-            # Render the world behind pause overlay (freeze gameplay)
-            engine.render(SCREEN)
-            _draw_dim_overlay(SCREEN, alpha=170)
-
-            _draw_centered_text(SCREEN, title_font, "PAUSED", HEIGHT // 2 - 90, (250, 240, 150))
-            _draw_centered_text(SCREEN, font, "ENTER / ESC: Resume", HEIGHT // 2 - 20, (220, 220, 220))
-            _draw_centered_text(SCREEN, font, "BACKSPACE: Return to Menu", HEIGHT // 2 + 10, (200, 200, 200))
-            _draw_centered_text(SCREEN, font, "Q: Quit", HEIGHT // 2 + 40, (180, 180, 180))
-
-            pygame.display.flip()
+        if state in (GameState.MENU, GameState.PAUSED):
+            # The world is frozen here, so render it once and reuse the frame
+            if backdrop is None:
+                engine.render(SCREEN)
+                backdrop = SCREEN.copy()
+                screen_cache = None
+
+            if screen_cache is None or screen_cache_state != state:
+                screen_cache = backdrop.copy()
+                if state == GameState.MENU:
+                    # Background is the cached world frame so it still feels like a place
+                    _draw_dim_overlay(screen_cache, alpha=190)
+                    screen_cache.blits(menu_text, doreturn=False)
+                else:
+                    _draw_dim_overlay(screen_cache, alpha=170)
+                    screen_cache.blits(pause_text, doreturn=False)
+                screen_cache_state = state
+                repaint = True
+
+            message = save_message if state == GameState.MENU and save_message_timer > 0 else None
+
+            if repaint:
+                SCREEN.blit(screen_cache, (0, 0))
+                message_rect = None
+                if message:
+                    message_rect = SCREEN.blit(*_centered_text(font, message, HEIGHT // 2 + 95, (100, 255, 100)))
+                pygame.display.flip()
+                # Startup diagnostics wait until the menu is visible
+                engine.flush_startup_log()
+            elif message != shown_message:
+                # Only the save/load message line can change: restore what it
+                # covered and present just the old and new message rects
+                dirty = []
+                if message_rect:
+                    SCREEN.blit(screen_cache, message_rect, message_rect)
+                    dirty.append(message_rect)
+                message_rect = None
+                if message:
+                    message_rect = SCREEN.blit(*_centered_text(font, message, HEIGHT // 2 + 95, (100, 255, 100)))
+                    dirty.append(message_rect)
+                pygame.display.update(dirty)
+
+            repaint = False
+            shown_message = message
             continue
 
         # PLAYING
-        keys = pygame.key.get_pressed()
+        if keys_dirty:
+            keys = pygame.key.get_pressed()
+            keys_dirty = False
         engine.update(dt, keys, mouse_rel)
         engine.update_sounds(dt, sound_effects)
         engine.update_player_footsteps(
@@ -313,36 +444,25 @@ def main():
 
         engine.render(SCREEN)
 
-        # UI - FPS
-        
+        # UI - FPS (re-rendered a few times per second, not every frame)
+        fps_timer -= dt
+        if fps_surface is None or fps_timer <= 0:
+            fps_surface = font.render(f"FPS: {int(clock.get_fps())}", True, (180, 200, 230))
+            fps_timer = 0.25
+        SCREEN.blit(fps_surface, (10, 10))
 
         # Save message
         if save_message:
-            save_msg_surface = font.render(save_message, True, (100, 255, 100))
-            msg_x = WIDTH // 2 - save_msg_surface.get_width() // 2
-            SCREEN.blit(save_msg_surface, (msg_x, 70))
+            _draw_centered_text(SCREEN, font, save_message, 70, (100, 255, 100))
 
         # Help overlay
         if show_help:
-            help_y = HEIGHT - 280
-            help_texts = [
-                "=== CONTROLS ===",
-                "WASD: Move | M: Mouse Look | JL: Turn",
-                "SHIFT: Run | C: Crouch | SPACE: Jump",
-                "LEFT CLICK or E: Destroy Wall (aim at wall)",
-                "R: Toggle Performance | H: Help | ESC: Pause",
-                "=== SAVE/LOAD ===",
-                "F5: Quick Save (Slot 1) | F9: Quick Load (Slot 1)",
-                "=== DESTRUCTION ===",
-                "Aim center crosshair at wall and click to destroy",
-                "Watch debris pile form on the floor!",
-            ]
-
-            for i, text in enumerate(help_texts):
-                help_surface = font.render(text, True, (250, 240, 150))
-                SCREEN.blit(help_surface, (10, help_y + i * 25))
+            SCREEN.blits(help_text, doreturn=False)
 
         pygame.display.flip()
+        # The next MENU/PAUSED frame starts from a fresh full present
+        screen_cache = None
+        repaint = True
 
     # Cleanup
     try:
@@ -1,6 +1,6 @@
 """
 Raycasting utilities.
-Möller–Trumbore algorithm for ray-triangle intersection.
+Möller–Trumbore algorithm for ray-triangle intersection, scalar and batched.
 """
 
 import numpy as np
@@ -41,3 +41,59 @@ def ray_intersects_triangle(ray_origin, ray_dir, v0, v1, v2):
         return (t, (v0, v1, v2))
 
     return None
+
+
+def ray_intersects_triangles(ray_origin, ray_dir, triangles):
+    """
+    Vectorized Möller–Trumbore against many triangles at once.
+    triangles: array-like of shape (N, 3, 3), one (v0, v1, v2) per row.
+    Returns an (N,) array of hit distances, np.inf where the ray misses.
+    """
+    epsilon = 0.0000001
+
+    tris = np.asarray(triangles, dtype=float)
+    ox, oy, oz = (float(c) for c in ray_origin)
+    dx, dy, dz = (float(c) for c in ray_dir)
+
+    # Component columns: the small cross/dot products are cheaper written
+    # out than through np.cross / einsum on (N, 3) arrays
+    v0x, v0y, v0z = tris[:, 0, 0], tris[:, 0, 1], tris[:, 0, 2]
+    e1x, e1y, e1z = tris[:, 1, 0] - v0x, tris[:, 1, 1] - v0y, tris[:, 1, 2] - v0z
+    e2x, e2y, e2z = tris[:, 2, 0] - v0x, tris[:, 2, 1] - v0y, tris[:, 2, 2] - v0z
+
+    hx = dy * e2z - dz * e2y
+    hy = dz * e2x - dx * e2z
+    hz = dx * e2y - dy * e2x
+    a = e1x * hx + e1y * hy + e1z * hz
+
+    parallel = np.abs(a) < epsilon
+    f = 1.0 / np.where(parallel, 1.0, a)
+    sx, sy, sz = ox - v0x, oy - v0y, oz - v0z
+    u = f * (sx * hx + sy * hy + sz * hz)
+
+    qx = sy * e1z - sz * e1y
+    qy = sz * e1x - sx * e1z
+    qz = sx * e1y - sy * e1x
+    v = f * (dx * qx + dy * qy + dz * qz)
+    t = f * (e2x * qx + e2y * qy + e2z * qz)
+
+    hit = ~parallel & (u >= 0.0) & (u <= 1.0) & (v >= 0.0) & (u + v <= 1.0) & (t > epsilon)
+    return np.where(hit, t, np.inf)
+
+
+def nearest_ray_hit(ray_origin, ray_dir, triangles, max_distance=np.inf):
+    """
+    Closest triangle hit by the ray within max_distance.
+    Returns (index, distance) of the first nearest triangle, None if none hit.
+    """
+    if len(triangles) == 0:
+        return None
+
+    distances = ray_intersects_triangles(ray_origin, ray_dir, triangles)
+    index = int(distances.argmin())
+    distance = float(distances[index])
+
+    if distance < max_distance:
+        return (index, distance)
+
+    return None
@@ -39,7 +39,7 @@ class SaveSystem:
             },
             'world': {
                 'seed': engine.world_seed,
-                'destroyed_walls': [list(wall) for wall in engine.destroyed_walls]
+                'destroyed_walls': [list(engine._decode_key(wall)) for wall in engine.destroyed_walls]
             },
             'stats': {
                 'play_time': engine.play_time